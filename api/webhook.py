@@ -1,20 +1,30 @@
 """Vercel serverless function for Telegram webhook."""
 
+import asyncio
+import functools
 import json
 import logging
 import os
 import sys
 import time
-from typing import List, Optional, Set
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple
 
 # Add project root to path so we can import from src/
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 logger = logging.getLogger(__name__)
+# An unknown LOG_LEVEL falls back to WARNING instead of failing the import
+_log_level = os.getenv('LOG_LEVEL', 'WARNING').upper()
+logger.setLevel(_log_level if _log_level in logging.getLevelNamesMapping() else logging.WARNING)
 
-from pymongo import MongoClient
+import httpx
+from pymongo import AsyncMongoClient, WriteConcern
 from telegram import Update, Bot, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.error import TelegramError
+from telegram.error import RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
 from src.models import Film
 from src.scraper import MeisengeigeScraper
@@ -43,24 +53,112 @@ CINEMA_SOURCES = {
     }
 }
 
+# Translated source names keyed by (source_id, lang), derived once from CINEMA_SOURCES
+_CINEMA_NAMES = {
+    (source_id, key.removeprefix('display_name_')): name
+    for source_id, source in CINEMA_SOURCES.items()
+    for key, name in source.items()
+    if key.startswith('display_name_')
+}
+
+
+def get_source_name(source_id: str, lang: str) -> str:
+    """Get a source's display name in the given language."""
+    name = _CINEMA_NAMES.get((source_id, lang))
+    return name if name is not None else CINEMA_SOURCES[source_id]['display_name']
 
-# MongoDB connection helper — lazy singleton
-_mongo_db = None
+
+# MongoDB connection helper — one client per process, shared by all managers
+_mongo_client: Optional[AsyncMongoClient] = None
+_indexes_ready = False
+
+MONGO_DB_NAME = 'nuernberg_kino_bot'
+FILMS_CACHE_COLLECTION = 'films_cache'
+USERS_COLLECTION = 'users'
+BOT_META_COLLECTION = 'bot_meta'
+KINDERKINO_DETAILS_COLLECTION = 'kinderkino_details'
+KINDERKINO_DETAIL_TTL = 24 * 3600  # detail pages rarely change once published
+KINDERKINO_DETAIL_LOCAL_TTL = 3600  # in-process copy, bounds staleness per instance
 
 
 def get_mongodb_database():
-    """Get MongoDB database instance (shared singleton, lazy init)."""
-    global _mongo_db
-    if _mongo_db is None:
+    """Get MongoDB database instance (shared client, lazy init)."""
+    global _mongo_client
+    if _mongo_client is None:
         mongodb_uri = os.getenv('MONGODB_URI')
         if not mongodb_uri:
             raise ValueError("MONGODB_URI environment variable not set")
         try:
-            client = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000)
-            _mongo_db = client['nuernberg_kino_bot']
+            # connect=False defers the handshake to the first real query, so
+            # cold starts that never touch the DB don't pay for it
+            _mongo_client = AsyncMongoClient(
+                mongodb_uri,
+                maxPoolSize=10,
+                minPoolSize=1,
+                serverSelectionTimeoutMS=3000,
+                connect=False,
+            )
         except Exception:
             raise ConnectionError("Failed to connect to MongoDB")
-    return _mongo_db
+    return _mongo_client[MONGO_DB_NAME]
+
+
+async def ensure_indexes() -> None:
+    """Create collection indexes once per process instead of on every request."""
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    try:
+        db = get_mongodb_database()
+        # Users are keyed by _id = chat_id; this serves per-source lookups and carries
+        # the chat ID, so they need not load whole documents
+        await db[USERS_COLLECTION].create_index([('sources', 1), ('_id', 1)])
+        # Expired scrape results are removed by MongoDB's TTL monitor
+        await db[FILMS_CACHE_COLLECTION].create_index('expires_at', expireAfterSeconds=0)
+        await db[KINDERKINO_DETAILS_COLLECTION].create_index(
+            'fetched_at', expireAfterSeconds=KINDERKINO_DETAIL_TTL
+        )
+        _indexes_ready = True
+    except Exception as e:
+        logger.warning(f"Failed to ensure MongoDB indexes: {e}")
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        """Return the cached value, or `_MISSING` if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        """Drop a single entry (no-op if absent)."""
+        self._data.pop(key, None)
+
+
+USER_CACHE_TTL = 30  # seconds; bounds staleness across parallel Vercel instances
 
 
 class BaseMongoManager:
@@ -70,6 +168,7 @@ class BaseMongoManager:
 
     def __init__(self):
         self._collection = None
+        self._user_cache = TTLCache(ttl=USER_CACHE_TTL)
 
     @property
     def collection(self):
@@ -77,139 +176,147 @@ class BaseMongoManager:
             self._collection = get_mongodb_database()[self.collection_name]
         return self._collection
 
+    async def find_user_doc(self, chat_id: int) -> Optional[dict]:
+        """Fetch the document for a user (or None), cached per chat_id."""
+        doc = self._user_cache.get(chat_id)
+        if doc is _MISSING:
+            doc = await self.collection.find_one({'_id': chat_id})
+            self._user_cache.set(chat_id, doc)
+        return doc
 
-class SubscriberManager(BaseMongoManager):
-    """Manages the list of subscribers for notifications using MongoDB."""
+    def invalidate_user(self, chat_id: int) -> None:
+        """Forget the cached document after a write for this user."""
+        self._user_cache.invalidate(chat_id)
 
-    collection_name = 'subscribers'
 
-    def add_subscription(self, chat_id: int, source_id: str) -> bool:
-        """Add subscription to specific source."""
-        doc = self.collection.find_one({'chat_id': chat_id})
-
-        if doc:
-            # User exists, add source if not already subscribed
-            sources = doc.get('sources', [])
-            if source_id in sources:
-                return False
-            sources.append(source_id)
-            self.collection.update_one(
-                {'chat_id': chat_id},
-                {'$set': {'sources': sources}}
-            )
-            return True
-        else:
-            # New user
-            self.collection.insert_one({
-                'chat_id': chat_id,
-                'sources': [source_id],
-                'language': 'en'
-            })
-            return True
-
-    def remove_subscription(self, chat_id: int, source_id: str) -> bool:
-        """Remove subscription from specific source."""
-        doc = self.collection.find_one({'chat_id': chat_id})
-        if not doc:
-            return False
+# Users that have at least one subscription
+SUBSCRIBED_FILTER = {'sources.0': {'$exists': True}}
 
-        sources = doc.get('sources', [])
-        if source_id not in sources:
-            return False
 
-        sources.remove(source_id)
+class UserManager(BaseMongoManager):
+    """
+    Manages per-user state in one MongoDB document per user.
 
-        if not sources:
-            # No sources left, remove user entirely
-            self.collection.delete_one({'chat_id': chat_id})
-        else:
-            self.collection.update_one(
-                {'chat_id': chat_id},
-                {'$set': {'sources': sources}}
-            )
-        return True
+    Document: {_id: chat_id, sources: [...], language: 'de', version: '1.2.0'};
+    fields are absent until first set.
+    """
+
+    collection_name = USERS_COLLECTION
 
-    def get_subscribers_for_source(self, source_id: str) -> Set[int]:
+    # Subscriptions
+
+    async def add_subscription(self, chat_id: int, source_id: str) -> bool:
+        """Add subscription to specific source."""
+        # Single atomic upsert: no read-modify-write race between webhook instances
+        result = await self.collection.update_one(
+            {'_id': chat_id},
+            {'$addToSet': {'sources': source_id}},
+            upsert=True
+        )
+        self.invalidate_user(chat_id)
+        return result.modified_count > 0 or result.upserted_id is not None
+
+    async def remove_subscription(self, chat_id: int, source_id: str) -> bool:
+        """Remove subscription from specific source."""
+        # The document stays: it also holds the language and seen version
+        result = await self.collection.update_one(
+            {'_id': chat_id, 'sources': source_id},
+            {'$pull': {'sources': source_id}}
+        )
+        self.invalidate_user(chat_id)
+        return result.modified_count > 0
+
+    async def get_subscribers_for_source(self, source_id: str) -> Set[int]:
         """Get all subscribers for a specific source."""
-        docs = self.collection.find({'sources': source_id}, {'chat_id': 1})
-        return {doc['chat_id'] for doc in docs}
+        # distinct returns one flat array instead of a document per subscriber
+        return set(await self.collection.distinct('_id', {'sources': source_id}))
 
-    def get_user_sources(self, chat_id: int) -> List[str]:
+    async def get_user_sources(self, chat_id: int) -> List[str]:
         """Get list of sources user is subscribed to."""
-        doc = self.collection.find_one({'chat_id': chat_id})
-        return doc.get('sources', []) if doc else []
+        doc = await self.find_user_doc(chat_id)
+        return list(doc.get('sources', [])) if doc else []
 
-    def is_subscribed(self, chat_id: int, source_id: Optional[str] = None) -> bool:
+    async def is_subscribed(self, chat_id: int, source_id: Optional[str] = None) -> bool:
         """Check if user is subscribed."""
-        doc = self.collection.find_one({'chat_id': chat_id})
-        if not doc:
-            return False
+        sources = await self.get_user_sources(chat_id)
         if source_id is None:
-            return len(doc.get('sources', [])) > 0
-        return source_id in doc.get('sources', [])
+            return len(sources) > 0
+        return source_id in sources
 
-    def get_subscriber_count(self, source_id: Optional[str] = None) -> int:
+    async def get_subscriber_count(self, source_id: Optional[str] = None) -> int:
         """Get subscriber count."""
         if source_id is None:
-            return self.collection.count_documents({})
-        return self.collection.count_documents({'sources': source_id})
+            return await self.collection.count_documents(SUBSCRIBED_FILTER)
+        return await self.collection.count_documents({'sources': source_id})
 
     # Legacy methods for backward compatibility
-    def add_subscriber(self, chat_id: int) -> bool:
+    async def add_subscriber(self, chat_id: int) -> bool:
         """Legacy: Add subscriber to Meisengeige by default."""
-        return self.add_subscription(chat_id, 'meisengeige')
+        return await self.add_subscription(chat_id, 'meisengeige')
 
-    def remove_subscriber(self, chat_id: int) -> bool:
+    async def remove_subscriber(self, chat_id: int) -> bool:
         """Legacy: Remove all subscriptions."""
-        result = self.collection.delete_one({'chat_id': chat_id})
-        return result.deleted_count > 0
+        result = await self.collection.update_one(
+            {'_id': chat_id, **SUBSCRIBED_FILTER},
+            {'$set': {'sources': []}}
+        )
+        self.invalidate_user(chat_id)
+        return result.modified_count > 0
 
-    def get_all_subscribers(self) -> Set[int]:
+    async def get_all_subscribers(self) -> Set[int]:
         """Legacy: Get all subscriber chat IDs."""
-        docs = self.collection.find({}, {'chat_id': 1})
-        return {doc['chat_id'] for doc in docs}
+        return set(await self.collection.distinct('_id', SUBSCRIBED_FILTER))
 
+    # Language
 
-class LanguageManager(BaseMongoManager):
-    """Manages user language preferences using MongoDB."""
-
-    collection_name = 'languages'
-
-    def set_language(self, chat_id: int, language: str) -> None:
+    async def set_language(self, chat_id: int, language: str) -> None:
         """Set language preference for a user."""
-        self.collection.update_one(
-            {'chat_id': chat_id},
+        await self.collection.update_one(
+            {'_id': chat_id},
             {'$set': {'language': language}},
             upsert=True
         )
+        self.invalidate_user(chat_id)
 
-    def get_language(self, chat_id: int) -> str:
+    async def get_language(self, chat_id: int) -> str:
         """Get language preference for a user (default: ru)."""
-        doc = self.collection.find_one({'chat_id': chat_id})
-        return doc['language'] if doc else 'ru'
+        doc = await self.find_user_doc(chat_id)
+        return doc.get('language', 'ru') if doc else 'ru'
 
-    def has_language_set(self, chat_id: int) -> bool:
+    async def has_language_set(self, chat_id: int) -> bool:
         """Check if user has explicitly set a language preference."""
-        return self.collection.find_one({'chat_id': chat_id}) is not None
-
+        doc = await self.find_user_doc(chat_id)
+        return doc is not None and 'language' in doc
 
-class UserVersionManager(BaseMongoManager):
-    """Manages user version tracking for update notifications."""
+    # Seen bot version
 
-    collection_name = 'user_versions'
-
-    def set_version(self, chat_id: int, version: str) -> None:
+    async def set_version(self, chat_id: int, version: str) -> None:
         """Set the bot version that user has seen."""
-        self.collection.update_one(
-            {'chat_id': chat_id},
+        await self.collection.update_one(
+            {'_id': chat_id},
             {'$set': {'version': version}},
             upsert=True
         )
+        self.invalidate_user(chat_id)
 
-    def get_version(self, chat_id: int) -> str:
+    async def get_version(self, chat_id: int) -> str:
         """Get the bot version that user has seen (default: '0.0.0')."""
-        doc = self.collection.find_one({'chat_id': chat_id})
-        return doc['version'] if doc else '0.0.0'
+        doc = await self.find_user_doc(chat_id)
+        return doc.get('version', '0.0.0') if doc else '0.0.0'
+
+
+@dataclass
+class UserContext:
+    """Stored preferences of one user, loaded once per update."""
+
+    chat_id: int
+    language: str = 'ru'
+    language_set: bool = False
+    sources: List[str] = field(default_factory=list)
+
+    @property
+    def is_subscribed(self) -> bool:
+        return len(self.sources) > 0
 
 
 # Bot version and update messages
@@ -303,6 +410,7 @@ TRANSLATIONS = {
         'duration_min': 'мин',
         'more_showtimes': '... и ещё {count} сеансов',
         'film_details_error': '❌ Ошибка при загрузке деталей фильма. Попробуйте снова.',
+        'subscription_error': '❌ Не удалось изменить подписку. Попробуйте снова.',
     },
     'de': {
         'choose_language': '🌍 Sprache wählen',
@@ -348,6 +456,7 @@ TRANSLATIONS = {
         'duration_min': 'Min',
         'more_showtimes': '... und {count} weitere Vorstellungen',
         'film_details_error': '❌ Filmdetails konnten nicht geladen werden. Bitte versuchen Sie es erneut.',
+        'subscription_error': '❌ Abonnement konnte nicht geändert werden. Bitte versuchen Sie es erneut.',
     },
     'en': {
         'choose_language': '🌍 Choose language',
@@ -393,133 +502,455 @@ TRANSLATIONS = {
         'duration_min': 'min',
         'more_showtimes': '... and {count} more showtimes',
         'film_details_error': '❌ Failed to load film details. Please try again.',
+        'subscription_error': '❌ Failed to update your subscription. Please try again.',
     }
 }
 
 
-def get_text(chat_id: int, key: str, **kwargs) -> str:
-    """Get translated text for a user."""
-    lang = language_manager.get_language(chat_id)
-    text = TRANSLATIONS.get(lang, TRANSLATIONS['ru']).get(key, key)
-    if kwargs:
-        text = text.format(**kwargs)
-    return text
+# Flattened (language, key) -> text lookup, built once at import time
+_FLAT_TRANSLATIONS = {
+    (lang, key): text
+    for lang, texts in TRANSLATIONS.items()
+    for key, text in texts.items()
+}
+
 
+def get_text(ctx: UserContext, key: str, **kwargs) -> str:
+    """Get translated text in the user's language (falls back to Russian)."""
+    text = _FLAT_TRANSLATIONS.get((ctx.language, key))
+    if text is None:
+        text = _FLAT_TRANSLATIONS.get(('ru', key), key)
+    return text.format_map(kwargs) if kwargs else text
 
-# Cache for film data
-_films_cache: Optional[List[Film]] = None
-_films_cache_time: Optional[float] = None
+
+def _escape_braces(text: str) -> str:
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+# Welcome caption template per language; only {name} is left to fill in
+_WELCOME_TEMPLATES = {
+    lang: (
+        f"{texts['welcome_title']}\n\n"
+        f"{_escape_braces(texts['welcome_desc'])}\n\n"
+        f"{_escape_braces(texts['capabilities'])}\n"
+        f"{_escape_braces(texts['capability_view'])}\n"
+        f"{_escape_braces(texts['capability_new'])}\n"
+        f"{_escape_braces(texts['capability_updates'])}\n"
+        f"{_escape_braces(texts['capability_removed'])}\n\n"
+        f"{_escape_braces(texts['use_menu'])}"
+    )
+    for lang, texts in TRANSLATIONS.items()
+}
+
+
+# In-process cache for film data: source_id -> (films, expires_at timestamp)
+_films_cache: Dict[str, Tuple[List[Film], float]] = {}
 CACHE_TTL = 300  # 5 minutes in seconds
+FILMS_MAX_STALE = 3600  # expired films older than this are refetched before replying
+_films_refreshing: Set[str] = set()  # sources with a refresh in flight
 MAX_DESCRIPTION_LENGTH = 600  # Telegram photo caption limit is 1024 chars, leave room for metadata
 
 
+# Shared HTTP client for cinema websites — reused across warm invocations
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client used by the scrapers (lazy init)."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            # Enough idle connections for the concurrent Kinderkino detail fetches
+            limits=httpx.Limits(max_keepalive_connections=FilmhausScraper.DETAIL_CONCURRENCY),
+        )
+    return _http_client
+
+
 # Film scraping functionality
-def fetch_current_films(source_id: str = 'meisengeige') -> List[Film]:
+async def fetch_current_films(source_id: str = 'meisengeige') -> List[Film]:
     """
     Fetch current films from cinema website with caching.
 
+    An expired in-process entry is still served (stale-while-revalidate) while a
+    background task refreshes it, unless it is older than FILMS_MAX_STALE.
+
     Args:
         source_id: Cinema source ID ('meisengeige' or 'kinderkino')
 
     Returns:
         List of Film objects
     """
-    global _films_cache, _films_cache_time
+    entry = _films_cache.get(source_id)
+    if entry is not None:
+        films, expires_at = entry
+        current_time = time.time()
+        if current_time < expires_at:
+            logger.debug("Using cached films data for %s", source_id)
+            return films
+        if current_time - expires_at < FILMS_MAX_STALE:
+            if source_id not in _films_refreshing:
+                logger.debug("Serving stale films for %s, refreshing in background", source_id)
+                # Marked before the task starts, so a second call in the same tick skips it
+                _films_refreshing.add(source_id)
+                run_in_background(refresh_films(source_id))
+            return films
+
+    _films_refreshing.add(source_id)
+    return await refresh_films(source_id)
+
+
+async def refresh_films(source_id: str) -> List[Film]:
+    """
+    Reload a source's films into the in-process cache.
 
-    # Per-source cache key
-    cache_key = f"{source_id}_cache"
-    cache_time_key = f"{source_id}_cache_time"
+    Reads the shared MongoDB cache first and only scrapes the website on a miss.
+    The caller adds source_id to _films_refreshing; it is cleared here when done.
 
-    # Check if cache is valid
-    current_time = time.time()
-    if cache_key in globals() and cache_time_key in globals():
-        cache_age = current_time - globals()[cache_time_key]
-        if cache_age < CACHE_TTL:
-            logger.debug(f"Using cached films data for {source_id} (age: {int(cache_age)}s)")
-            return globals()[cache_key]
-
-    # Fetch fresh data based on source
-    logger.debug(f"Fetching fresh films data from {source_id}...")
-
-    if source_id == 'meisengeige':
-        films = fetch_meisengeige_films()
-    elif source_id == 'kinderkino':
-        films = fetch_kinderkino_films()
-    else:
-        logger.error(f"Unknown source_id: {source_id}")
-        return []
+    Args:
+        source_id: Cinema source ID
 
-    # Update cache
-    globals()[cache_key] = films
-    globals()[cache_time_key] = current_time
+    Returns:
+        List of Film objects
+    """
+    try:
+        # Shared cache in MongoDB, so other instances don't re-scrape
+        cached = await load_cached_films(source_id)
+        if cached is not None:
+            films, expires_at = cached
+            logger.debug("Using shared films cache for %s", source_id)
+            _films_cache[source_id] = (films, expires_at)
+            return films
+
+        # Fetch fresh data based on source
+        logger.debug("Fetching fresh films data from %s...", source_id)
+
+        if source_id == 'meisengeige':
+            films = await fetch_meisengeige_films()
+        elif source_id == 'kinderkino':
+            films = await fetch_kinderkino_films()
+        else:
+            logger.error(f"Unknown source_id: {source_id}")
+            return []
 
-    return films
+        if films is None:
+            # Failed scrape - keep the last known program (with its original expiry,
+            # so FILMS_MAX_STALE still bounds its age) and retry on the next request
+            previous = _films_cache.get(source_id)
+            if previous is not None and time.time() - previous[1] < FILMS_MAX_STALE:
+                return previous[0]
+            return []
 
+        # Update cache (an empty program is a valid result and is cached as-is)
+        _films_cache[source_id] = (films, time.time() + CACHE_TTL)
+        await store_cached_films(source_id, films)
 
-def fetch_meisengeige_films() -> List[Film]:
-    """Fetch films from Meisengeige website using src/ scraper."""
-    try:
-        with MeisengeigeScraper() as scraper:
-            films = scraper.scrape()
-        logger.debug(f"Fetched {len(films)} films from Meisengeige")
         return films
+    finally:
+        _films_refreshing.discard(source_id)
+
+
+# film_id -> Film per source, rebuilt only when the cached films list changes
+_film_indexes: dict = {}
+
+
+def get_film_index(source_id: str, films: List[Film]) -> dict:
+    """Get the film_id -> Film mapping for a source's current films list."""
+    cached = _film_indexes.get(source_id)
+    if cached is None or cached[0] is not films:
+        cached = (films, {film.film_id: film for film in films if film.film_id})
+        _film_indexes[source_id] = cached
+    return cached[1]
+
+
+async def load_cached_films(source_id: str) -> Optional[tuple]:
+    """
+    Load unexpired films for a source from the shared MongoDB cache.
+
+    Args:
+        source_id: Cinema source ID
+
+    Returns:
+        (films, expires_at timestamp) tuple, or None on miss or error
+    """
+    try:
+        db = get_mongodb_database()
+        doc = await db[FILMS_CACHE_COLLECTION].find_one({
+            '_id': source_id,
+            'expires_at': {'$gt': datetime.now(timezone.utc)}
+        })
     except Exception as e:
-        logger.error(f"Failed to fetch Meisengeige films: {e}")
-        return []
+        logger.warning(f"Failed to read films cache for {source_id}: {e}")
+        return None
+
+    if not doc:
+        return None
+
+    films = [Film.from_dict(data) for data in doc.get('films', [])]
+    # PyMongo returns naive datetimes in UTC
+    expires_at = doc['expires_at'].replace(tzinfo=timezone.utc).timestamp()
+    return films, expires_at
 
 
-def fetch_kinderkino_films() -> List[Film]:
-    """Fetch films from Kinderkino (Filmhaus) website using src/ scraper."""
+async def store_cached_films(source_id: str, films: List[Film]) -> None:
+    """Store freshly scraped films (possibly none) in the shared MongoDB cache."""
     try:
-        with FilmhausScraper() as scraper:
-            films = scraper.scrape()
-        logger.debug(f"Fetched {len(films)} films from Kinderkino")
-        return films
+        db = get_mongodb_database()
+        await db[FILMS_CACHE_COLLECTION].replace_one(
+            {'_id': source_id},
+            {
+                'films': [film.to_dict() for film in films],
+                'expires_at': datetime.now(timezone.utc) + timedelta(seconds=CACHE_TTL)
+            },
+            upsert=True
+        )
     except Exception as e:
-        logger.error(f"Failed to fetch Kinderkino films: {e}")
-        return []
+        logger.warning(f"Failed to write films cache for {source_id}: {e}")
 
 
-# Initialize subscriber manager
+class KinderkinoDetailCache:
+    """
+    Parsed Kinderkino detail pages, keyed by detail URL.
+
+    An in-process TTLCache sits in front of the shared MongoDB collection, so
+    refreshes on a warm instance don't query MongoDB for pages they already know.
+    """
+
+    def __init__(self):
+        self._local = TTLCache(ttl=KINDERKINO_DETAIL_LOCAL_TTL, maxsize=256)
+
+    async def load(self, urls: List[str]) -> Dict[str, dict]:
+        """Get unexpired detail info for the given URLs (one query for local misses)."""
+        found = {}
+        missing = []
+        for url in urls:
+            info = self._local.get(url)
+            if info is _MISSING:
+                missing.append(url)
+            else:
+                found[url] = info
+        if not missing:
+            return found
+
+        db = get_mongodb_database()
+        cursor = db[KINDERKINO_DETAILS_COLLECTION].find({
+            '_id': {'$in': missing},
+            'fetched_at': {
+                '$gt': datetime.now(timezone.utc) - timedelta(seconds=KINDERKINO_DETAIL_TTL)
+            }
+        })
+        async for doc in cursor:
+            found[doc['_id']] = doc['info']
+            self._local.set(doc['_id'], doc['info'])
+        return found
+
+    async def store(self, url: str, info: dict) -> None:
+        """Remember freshly parsed detail info (unacknowledged write)."""
+        self._local.set(url, info)
+        try:
+            db = get_mongodb_database()
+            collection = db[KINDERKINO_DETAILS_COLLECTION].with_options(
+                write_concern=WriteConcern(w=0)
+            )
+            await collection.replace_one(
+                {'_id': url},
+                {'info': info, 'fetched_at': datetime.now(timezone.utc)},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write Kinderkino detail cache for {url}: {e}")
+
+
+kinderkino_detail_cache = KinderkinoDetailCache()
+
+
+async def fetch_meisengeige_films() -> Optional[List[Film]]:
+    """Fetch films from Meisengeige website using src/ scraper (None on failure)."""
+    try:
+        async with MeisengeigeScraper(client=get_http_client()) as scraper:
+            films = await scraper.scrape()
+        logger.debug("Fetched %d films from Meisengeige", len(films))
+        return films
+    except Exception:
+        logger.exception("Failed to fetch Meisengeige films")
+        return None
+
+
+async def fetch_kinderkino_films() -> Optional[List[Film]]:
+    """Fetch films from Kinderkino (Filmhaus) website using src/ scraper (None on failure)."""
+    try:
+        async with FilmhausScraper(
+            client=get_http_client(), detail_cache=kinderkino_detail_cache
+        ) as scraper:
+            films = await scraper.scrape()
+        logger.debug("Fetched %d films from Kinderkino", len(films))
+        return films
+    except Exception:
+        logger.exception("Failed to fetch Kinderkino films")
+        return None
+
+
+# Initialize user manager
 BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
 if not BOT_TOKEN:
     raise ValueError("TELEGRAM_BOT_TOKEN environment variable not set")
 
-subscriber_manager = SubscriberManager()
-language_manager = LanguageManager()
-version_manager = UserVersionManager()
+user_manager = UserManager()
+
+# Shared Bot instance — reused across warm invocations
+TELEGRAM_POOL_SIZE = 32
+_bot: Optional[Bot] = None
+
+
+def get_bot() -> Bot:
+    """Get the shared Bot with a sized HTTPX connection pool (lazy init)."""
+    global _bot
+    if _bot is None:
+        request = HTTPXRequest(
+            connection_pool_size=TELEGRAM_POOL_SIZE,
+            pool_timeout=10.0,
+            connect_timeout=5.0,
+            read_timeout=10.0,
+        )
+        _bot = Bot(token=BOT_TOKEN, request=request)
+    return _bot
+
+
+# Side work (bot setup, seen-version writes, film refreshes) runs alongside the rest
+# of the update; strong refs keep the tasks from being garbage-collected before they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def run_in_background(coro) -> asyncio.Task:
+    """
+    Schedule a coroutine without awaiting it.
+
+    The task overlaps the rest of the update, but it is not fire-and-forget:
+    process_update drains it before do_POST writes the HTTP response.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def drain_background_tasks() -> None:
+    """Wait for pending background tasks, logging any failures."""
+    while _background_tasks:
+        results = await asyncio.gather(*_background_tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Background task failed: {result}")
+
+
+# Telegram file_id per photo URL: once Telegram has fetched an image, resending by
+# file_id skips the download from the cinema website
+PHOTO_FILE_ID_TTL = 24 * 3600
+_photo_file_ids = TTLCache(ttl=PHOTO_FILE_ID_TTL, maxsize=512)
+
+
+async def send_cached_photo(bot: Bot, chat_id: int, photo_url: str, **kwargs):
+    """
+    Send a photo by URL, reusing Telegram's file_id for URLs sent before.
+
+    Args:
+        bot: Bot instance
+        chat_id: Target chat ID
+        photo_url: Image URL
+        **kwargs: Passed through to bot.send_photo (caption, parse_mode, ...)
+
+    Returns:
+        The sent Message
+    """
+    file_id = _photo_file_ids.get(photo_url)
+    if file_id is not _MISSING:
+        try:
+            return await bot.send_photo(chat_id=chat_id, photo=file_id, **kwargs)
+        except TelegramError as e:
+            # Stale file_id - forget it and retry once with the original URL
+            logger.debug("Cached file_id for %s rejected: %s", photo_url, e)
+            _photo_file_ids.invalidate(photo_url)
+
+    message = await bot.send_photo(chat_id=chat_id, photo=photo_url, **kwargs)
+    if message.photo:
+        _photo_file_ids.set(photo_url, message.photo[-1].file_id)
+    return message
+
+
+async def get_user_context(chat_id: int) -> UserContext:
+    """
+    Load language and subscriptions for a user with a single document read.
+
+    Handlers read from the returned context instead of querying MongoDB
+    for every translated line.
+    """
+    doc = await user_manager.find_user_doc(chat_id)
+    ctx = UserContext(chat_id=chat_id)
+    if doc:
+        if 'language' in doc:
+            ctx.language = doc['language']
+            ctx.language_set = True
+        ctx.sources = list(doc.get('sources', []))
+    return ctx
+
 
 # Track when bot commands were last set up (timestamp)
 _commands_last_set = 0
 _COMMANDS_CACHE_SECONDS = 3600  # Update commands max once per hour
+_commands_lock = asyncio.Lock()
+
+
+# Command menus per language, built once at import time
+_COMMANDS_BY_LANG = {
+    'ru': (
+        BotCommand("films", "🎥 Показать текущую программу"),
+        BotCommand("sources", "🎬 Управление подписками"),
+        BotCommand("status", "📊 Проверить статус подписки"),
+        BotCommand("language", "🌍 Выбрать язык"),
+        BotCommand("stop", "❌ Отписаться от всех уведомлений")
+    ),
+    'de': (
+        BotCommand("films", "🎥 Aktuelles Programm anzeigen"),
+        BotCommand("sources", "🎬 Abonnements verwalten"),
+        BotCommand("status", "📊 Abonnementstatus prüfen"),
+        BotCommand("language", "🌍 Sprache wählen"),
+        BotCommand("stop", "❌ Alle Benachrichtigungen abbestellen")
+    ),
+    'en': (
+        BotCommand("films", "🎥 Show current program"),
+        BotCommand("sources", "🎬 Manage subscriptions"),
+        BotCommand("status", "📊 Check subscription status"),
+        BotCommand("language", "🌍 Change language"),
+        BotCommand("stop", "❌ Unsubscribe from all notifications")
+    )
+}
 
 
-def get_commands_for_language(lang: str) -> list:
+def get_commands_for_language(lang: str) -> tuple:
     """Get bot commands for a specific language."""
-    commands_by_lang = {
-        'ru': [
-            BotCommand("films", "🎥 Показать текущую программу"),
-            BotCommand("sources", "🎬 Управление подписками"),
-            BotCommand("status", "📊 Проверить статус подписки"),
-            BotCommand("language", "🌍 Выбрать язык"),
-            BotCommand("stop", "❌ Отписаться от всех уведомлений")
-        ],
-        'de': [
-            BotCommand("films", "🎥 Aktuelles Programm anzeigen"),
-            BotCommand("sources", "🎬 Abonnements verwalten"),
-            BotCommand("status", "📊 Abonnementstatus prüfen"),
-            BotCommand("language", "🌍 Sprache wählen"),
-            BotCommand("stop", "❌ Alle Benachrichtigungen abbestellen")
-        ],
-        'en': [
-            BotCommand("films", "🎥 Show current program"),
-            BotCommand("sources", "🎬 Manage subscriptions"),
-            BotCommand("status", "📊 Check subscription status"),
-            BotCommand("language", "🌍 Change language"),
-            BotCommand("stop", "❌ Unsubscribe from all notifications")
-        ]
-    }
-    return commands_by_lang.get(lang, commands_by_lang['en'])
+    return _COMMANDS_BY_LANG.get(lang, _COMMANDS_BY_LANG['en'])
+
+
+# Static keyboards, built once at import time
+LANGUAGE_PROMPT = "🌍 Выберите язык / Choose language / Sprache wählen"
+
+
+def _language_keyboard(callback_prefix: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("🇷🇺 Русский", callback_data=f"{callback_prefix}ru")],
+        [InlineKeyboardButton("🇩🇪 Deutsch", callback_data=f"{callback_prefix}de")],
+        [InlineKeyboardButton("🇬🇧 English", callback_data=f"{callback_prefix}en")]
+    ])
+
+
+_LANG_KEYBOARD = _language_keyboard('lang_')
+_CHANGE_LANG_KEYBOARD = _language_keyboard('changelang_')
+_FILMS_SOURCE_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton(
+        f"🎬 {source['display_name']}", callback_data=f"films_source:{source_id}"
+    )]
+    for source_id, source in CINEMA_SOURCES.items()
+])
 
 
 async def set_user_commands(bot: Bot, chat_id: int, lang: str):
@@ -531,94 +962,115 @@ async def set_user_commands(bot: Bot, chat_id: int, lang: str):
         scope = BotCommandScopeChat(chat_id=chat_id)
 
         await bot.set_my_commands(commands, scope=scope)
-        logger.info(f"Set commands for user {chat_id} in language {lang}")
+        logger.info("Set commands for user %s in language %s", chat_id, lang)
     except Exception as e:
         logger.warning(f"Failed to set user-specific commands: {e}")
 
 
 async def setup_bot_commands(bot: Bot):
     """Set up bot command menu (updates max once per hour)."""
-    global _commands_last_set
-
     # Check if commands were set recently (within cache period)
-    current_time = time.time()
-    if current_time - _commands_last_set < _COMMANDS_CACHE_SECONDS:
+    if time.time() - _commands_last_set < _COMMANDS_CACHE_SECONDS:
         return
 
-    try:
-        # Set commands for each language globally
-        await bot.set_my_commands(get_commands_for_language('ru'), language_code="ru")
-        await bot.set_my_commands(get_commands_for_language('de'), language_code="de")
-        await bot.set_my_commands(get_commands_for_language('en'), language_code="en")
+    async with _commands_lock:
+        # A concurrent update may have finished the refresh while we waited
+        if time.time() - _commands_last_set < _COMMANDS_CACHE_SECONDS:
+            return
+        await _refresh_bot_commands(bot)
 
-        # Set default commands (fallback)
-        await bot.set_my_commands(get_commands_for_language('en'))
 
-        _commands_last_set = current_time
-        logger.info("Bot commands menu initialized for all languages")
+async def _refresh_bot_commands(bot: Bot) -> None:
+    global _commands_last_set
+    current_time = time.time()
+
+    # Another instance may have set them already - check the shared timestamp
+    try:
+        meta = get_mongodb_database()[BOT_META_COLLECTION]
+        doc = await meta.find_one({'_id': 'commands_set'})
+        if (doc and doc.get('version') == BOT_VERSION
+                and current_time - doc.get('ts', 0) < _COMMANDS_CACHE_SECONDS):
+            _commands_last_set = doc['ts']
+            return
     except Exception as e:
-        logger.warning(f"Failed to set bot commands: {e}")
+        meta = None
+        logger.warning(f"Failed to read bot commands timestamp: {e}")
+
+    # Set commands for each language globally, plus the default (fallback) menu
+    scopes = ('ru', 'de', 'en', None)
+    results = await asyncio.gather(
+        *(
+            bot.set_my_commands(get_commands_for_language(lang or 'en'), language_code=lang)
+            for lang in scopes
+        ),
+        return_exceptions=True
+    )
+    failed = False
+    for lang, result in zip(scopes, results):
+        if isinstance(result, Exception):
+            failed = True
+            logger.warning(f"Failed to set bot commands ({lang or 'default'}): {result}")
+    if failed:
+        return
 
+    _commands_last_set = current_time
+    logger.info("Bot commands menu initialized for all languages")
 
-async def handle_start_command(bot: Bot, chat_id: int, user_first_name: str) -> Optional[str]:
+    if meta is not None:
+        run_in_background(
+            meta.with_options(write_concern=WriteConcern(w=0)).update_one(
+                {'_id': 'commands_set'},
+                {'$set': {'ts': current_time, 'version': BOT_VERSION}},
+                upsert=True
+            )
+        )
+
+
+async def handle_start_command(bot: Bot, ctx: UserContext, user_first_name: str) -> Optional[str]:
     """
     Handle /start command with language selection.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
         user_first_name: User's first name
 
     Returns:
         Message to send (or None if photo was sent)
     """
     # If this is truly first time (no language set and not subscribed), show language selection
-    if not language_manager.has_language_set(chat_id) and not subscriber_manager.is_subscribed(chat_id):
+    if not ctx.language_set and not ctx.is_subscribed:
         # Show language selection buttons
-        keyboard = [
-            [InlineKeyboardButton("🇷🇺 Русский", callback_data="lang_ru")],
-            [InlineKeyboardButton("🇩🇪 Deutsch", callback_data="lang_de")],
-            [InlineKeyboardButton("🇬🇧 English", callback_data="lang_en")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await bot.send_message(
-            chat_id=chat_id,
-            text="🌍 Выберите язык / Choose language / Sprache wählen",
-            reply_markup=reply_markup
+            chat_id=ctx.chat_id,
+            text=LANGUAGE_PROMPT,
+            reply_markup=_LANG_KEYBOARD
         )
         return None
 
     # User has language preference - send welcome message without auto-subscription
     # Check if user is already subscribed to any source
-    if subscriber_manager.is_subscribed(chat_id):
+    if ctx.is_subscribed:
         # Already subscribed
-        return get_text(chat_id, 'already_subscribed', name=user_first_name)
+        return get_text(ctx, 'already_subscribed', name=user_first_name)
     else:
         # New user - send welcome message without auto-subscribing
-        await send_welcome_message(bot, chat_id, user_first_name)
+        await send_welcome_message(bot, ctx, user_first_name)
         return None
 
 
-async def send_welcome_message(bot: Bot, chat_id: int, user_first_name: str):
+async def send_welcome_message(bot: Bot, ctx: UserContext, user_first_name: str):
     """Send welcome message with photo in user's language."""
     welcome_image_url = "https://www.cinecitta.de/fileadmin/Seitenbanner/Seitenbanner_Meisengeige.jpg.pagespeed.ce.MUHRnnz-ET.jpg"
 
-    caption = (
-        f"{get_text(chat_id, 'welcome_title', name=user_first_name)}\n\n"
-        f"{get_text(chat_id, 'welcome_desc')}\n\n"
-        f"{get_text(chat_id, 'capabilities')}\n"
-        f"{get_text(chat_id, 'capability_view')}\n"
-        f"{get_text(chat_id, 'capability_new')}\n"
-        f"{get_text(chat_id, 'capability_updates')}\n"
-        f"{get_text(chat_id, 'capability_removed')}\n\n"
-        f"{get_text(chat_id, 'use_menu')}"
-    )
+    template = _WELCOME_TEMPLATES.get(ctx.language, _WELCOME_TEMPLATES['ru'])
+    caption = template.format_map({'name': user_first_name})
 
     try:
-        await bot.send_photo(
-            chat_id=chat_id,
-            photo=welcome_image_url,
+        await send_cached_photo(
+            bot,
+            ctx.chat_id,
+            welcome_image_url,
             caption=caption,
             parse_mode='HTML'
         )
@@ -626,108 +1078,113 @@ async def send_welcome_message(bot: Bot, chat_id: int, user_first_name: str):
         logger.error(f"Failed to send welcome photo: {e}")
         # Fallback to text message if photo fails
         await bot.send_message(
-            chat_id=chat_id,
+            chat_id=ctx.chat_id,
             text=caption,
             parse_mode='HTML'
         )
 
 
-async def handle_stop_command(bot: Bot, chat_id: int) -> str:
+async def handle_stop_command(bot: Bot, ctx: UserContext) -> str:
     """
     Handle /stop command.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
 
     Returns:
         Message to send
     """
-    if subscriber_manager.remove_subscriber(chat_id):
-        return get_text(chat_id, 'unsubscribed')
-    else:
-        return get_text(chat_id, 'not_subscribed')
+    if not ctx.is_subscribed:
+        return get_text(ctx, 'not_subscribed')
+
+    try:
+        removed = await user_manager.remove_subscriber(ctx.chat_id)
+    except Exception as e:
+        logger.error(f"Error removing subscriber {ctx.chat_id}: {e}")
+        return get_text(ctx, 'subscription_error')
 
+    ctx.sources.clear()
+    return get_text(ctx, 'unsubscribed' if removed else 'not_subscribed')
 
-async def handle_status_command(bot: Bot, chat_id: int) -> str:
+
+async def handle_status_command(bot: Bot, ctx: UserContext) -> str:
     """
     Handle /status command - show subscription status for all sources.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
 
     Returns:
         Message to send (with HTML formatting)
     """
     try:
-        logger.debug(f"Checking status for chat_id: {chat_id}")
-        user_sources = subscriber_manager.get_user_sources(chat_id)
+        logger.debug("Checking status for chat_id: %s", ctx.chat_id)
+        user_sources = ctx.sources
 
         if not user_sources:
-            return get_text(chat_id, 'status_inactive')
+            return get_text(ctx, 'status_inactive')
 
         # Build status message with source details
-        lang = language_manager.get_language(chat_id)
-        lines = [get_text(chat_id, 'status_active_multi')]
+        lang = ctx.language
+        lines = [get_text(ctx, 'status_active_multi')]
 
         for source_id in user_sources:
-            source = CINEMA_SOURCES.get(source_id)
-            if source:
-                name_key = f'display_name_{lang}'
-                display_name = source.get(name_key, source['display_name'])
-                lines.append(f"• {display_name}")
+            if source_id in CINEMA_SOURCES:
+                lines.append(f"• {get_source_name(source_id, lang)}")
 
-        lines.append(f"\n{get_text(chat_id, 'use_sources_cmd')}")
+        lines.append(f"\n{get_text(ctx, 'use_sources_cmd')}")
         return "\n".join(lines)
 
     except Exception as e:
         logger.error(f"Error in handle_status_command: {e}", exc_info=True)
-        return get_text(chat_id, 'unknown_command')
+        return get_text(ctx, 'unknown_command')
 
 
-async def handle_language_command(bot: Bot, chat_id: int) -> None:
+async def handle_language_command(bot: Bot, ctx: UserContext) -> None:
     """
     Handle /language command - show language selection.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
     """
     # Show language selection buttons
-    keyboard = [
-        [InlineKeyboardButton("🇷🇺 Русский", callback_data="changelang_ru")],
-        [InlineKeyboardButton("🇩🇪 Deutsch", callback_data="changelang_de")],
-        [InlineKeyboardButton("🇬🇧 English", callback_data="changelang_en")]
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await bot.send_message(
-        chat_id=chat_id,
-        text="🌍 Выберите язык / Choose language / Sprache wählen",
-        reply_markup=reply_markup
+        chat_id=ctx.chat_id,
+        text=LANGUAGE_PROMPT,
+        reply_markup=_CHANGE_LANG_KEYBOARD
     )
 
 
-async def handle_sources_command(bot: Bot, chat_id: int) -> None:
+async def handle_sources_command(bot: Bot, ctx: UserContext) -> None:
     """
     Handle /sources command - show available sources with subscribe/unsubscribe buttons.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
     """
-    lang = language_manager.get_language(chat_id)
-    user_sources = subscriber_manager.get_user_sources(chat_id)
+    await bot.send_message(
+        chat_id=ctx.chat_id,
+        text=get_text(ctx, 'sources_header'),
+        reply_markup=build_sources_keyboard(ctx.language, ctx.sources),
+        parse_mode='HTML'
+    )
+
+
+def build_sources_keyboard(lang: str, user_sources: List[str]) -> InlineKeyboardMarkup:
+    """Build the /sources keyboard with subscribe/unsubscribe buttons."""
+    return _sources_keyboard(lang, frozenset(user_sources))
 
-    # Build message
-    message = get_text(chat_id, 'sources_header')
 
-    # Build keyboard with source buttons
+@functools.lru_cache(maxsize=64)
+def _sources_keyboard(lang: str, user_sources: frozenset) -> InlineKeyboardMarkup:
+    # Few (language, subscriptions) combinations exist, and markups are immutable
     keyboard = []
-    for source_id, source_info in CINEMA_SOURCES.items():
-        name_key = f'display_name_{lang}'
-        display_name = source_info.get(name_key, source_info['display_name'])
+    for source_id in CINEMA_SOURCES:
+        display_name = get_source_name(source_id, lang)
 
         if source_id in user_sources:
             # Subscribed - show unsubscribe button
@@ -740,34 +1197,52 @@ async def handle_sources_command(bot: Bot, chat_id: int) -> None:
 
         keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
 
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    return InlineKeyboardMarkup(keyboard)
 
-    await bot.send_message(
-        chat_id=chat_id,
-        text=message,
-        reply_markup=reply_markup,
-        parse_mode='HTML'
+
+async def answer_subscription_toggle(bot: Bot, query, ctx: UserContext, message: str) -> None:
+    """
+    Confirm a sub:/unsub: click with a toast and refresh the /sources keyboard in place.
+
+    Args:
+        bot: Bot instance
+        query: The callback query being answered
+        ctx: User context with sources matching the saved state after this click
+        message: Confirmation text (must fit Telegram's 200-char toast limit)
+    """
+    results = await asyncio.gather(
+        bot.answer_callback_query(query.id, text=message),
+        bot.edit_message_reply_markup(
+            chat_id=ctx.chat_id,
+            message_id=query.message.message_id,
+            reply_markup=build_sources_keyboard(ctx.language, ctx.sources)
+        ),
+        return_exceptions=True
     )
+    for result in results:
+        # "Message is not modified" is expected when the keyboard was already current
+        if isinstance(result, Exception):
+            logger.debug("Subscription toggle reply failed: %s", result)
 
 
-async def check_and_notify_version_update(bot: Bot, chat_id: int) -> None:
+async def check_and_notify_version_update(bot: Bot, ctx: UserContext) -> None:
     """
     Check if user needs to see version update notification.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
     """
     # Only notify subscribed users
-    if not subscriber_manager.is_subscribed(chat_id):
+    if not ctx.is_subscribed:
         return
 
-    user_version = version_manager.get_version(chat_id)
+    user_version = await user_manager.get_version(ctx.chat_id)
 
     # If user is on old version and there's an update message
     if user_version != BOT_VERSION and BOT_VERSION in VERSION_UPDATES:
         # Get user's language
-        lang = language_manager.get_language(chat_id)
+        lang = ctx.language
 
         # Get update message in user's language
         update_message = VERSION_UPDATES[BOT_VERSION].get(lang, VERSION_UPDATES[BOT_VERSION]['en'])
@@ -775,44 +1250,88 @@ async def check_and_notify_version_update(bot: Bot, chat_id: int) -> None:
         # Send update notification
         try:
             await bot.send_message(
-                chat_id=chat_id,
+                chat_id=ctx.chat_id,
                 text=update_message,
                 parse_mode='HTML'
             )
             # Update user's version
-            version_manager.set_version(chat_id, BOT_VERSION)
+            run_in_background(user_manager.set_version(ctx.chat_id, BOT_VERSION))
         except Exception as e:
-            logger.warning(f"Failed to send version update to {chat_id}: {e}")
+            logger.warning(f"Failed to send version update to {ctx.chat_id}: {e}")
+
+
+def parse_admin_chat_ids(value: str) -> frozenset:
+    """Parse a comma-separated list of chat IDs, skipping malformed entries."""
+    chat_ids = set()
+    for cid in value.split(','):
+        cid = cid.strip()
+        if not cid:
+            continue
+        try:
+            chat_ids.add(int(cid))
+        except ValueError:
+            # A typo must not break the import (and with it every webhook request)
+            logger.warning(f"Ignoring invalid ADMIN_CHAT_IDS entry: {cid!r}")
+    return frozenset(chat_ids)
+
+
+# Admins allowed to use /broadcast, parsed once at import time
+ADMIN_CHAT_IDS = parse_admin_chat_ids(os.getenv('ADMIN_CHAT_IDS', ''))
+
+# Max concurrent sends during /broadcast (leaves headroom in the bot's connection pool)
+BROADCAST_CONCURRENCY = min(25, TELEGRAM_POOL_SIZE - 2)
+# Max sends per second during /broadcast (stays under Telegram's ~30 msg/s limit)
+BROADCAST_RATE = 25
+# Attempts per recipient when Telegram answers with RetryAfter (flood control)
+BROADCAST_MAX_ATTEMPTS = 3
+
+
+class AsyncRateLimiter:
+    """Spaces out acquisitions evenly so at most `rate` happen per `period` seconds."""
 
+    def __init__(self, rate: float, period: float = 1.0):
+        self._interval = period / rate
+        self._next_slot = 0.0
 
-async def handle_broadcast_command(bot: Bot, chat_id: int, message_text: str) -> str:
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def pause(self, seconds: float) -> None:
+        """Push every future slot back by at least `seconds` (e.g. after a 429)."""
+        resume_at = asyncio.get_running_loop().time() + seconds
+        self._next_slot = max(self._next_slot, resume_at)
+
+
+async def handle_broadcast_command(bot: Bot, ctx: UserContext, message_text: str) -> str:
     """
     Handle /broadcast command - send message to all subscribers (admin only).
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
         message_text: Full message text including command
 
     Returns:
         Response message
     """
     # Check if user is admin
-    admin_chat_ids_str = os.getenv('ADMIN_CHAT_IDS', '')
-    admin_chat_ids = [int(cid.strip()) for cid in admin_chat_ids_str.split(',') if cid.strip()]
-
-    if chat_id not in admin_chat_ids:
-        return get_text(chat_id, 'broadcast_no_permission')
+    if ctx.chat_id not in ADMIN_CHAT_IDS:
+        return get_text(ctx, 'broadcast_no_permission')
 
     # Extract message content after /broadcast
     parts = message_text.split(maxsplit=1)
     if len(parts) < 2:
-        return get_text(chat_id, 'broadcast_usage')
+        return get_text(ctx, 'broadcast_usage')
 
     broadcast_message = parts[1]
 
     # Get all subscribers
-    all_subscribers = subscriber_manager.get_all_subscribers()
+    all_subscribers = await user_manager.get_all_subscribers()
     total = len(all_subscribers)
 
     if total == 0:
@@ -820,134 +1339,235 @@ async def handle_broadcast_command(bot: Bot, chat_id: int, message_text: str) ->
 
     # Send status message
     await bot.send_message(
-        chat_id=chat_id,
-        text=get_text(chat_id, 'broadcast_sending', count=total)
+        chat_id=ctx.chat_id,
+        text=get_text(ctx, 'broadcast_sending', count=total)
     )
 
-    # Send message to all subscribers
-    success_count = 0
-    for subscriber_id in all_subscribers:
-        try:
-            await bot.send_message(
-                chat_id=subscriber_id,
-                text=broadcast_message,
-                parse_mode='HTML'
-            )
-            success_count += 1
-        except Exception as e:
-            logger.warning(f"Failed to send broadcast to {subscriber_id}: {e}")
+    # Send message to all subscribers concurrently, bounded by the semaphore
+    # and paced by the rate limiter to avoid 429 Too Many Requests
+    sem = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+    limiter = AsyncRateLimiter(BROADCAST_RATE)
+
+    async def send_one(subscriber_id: int) -> bool:
+        async with sem:
+            for attempt in range(BROADCAST_MAX_ATTEMPTS):
+                await limiter.acquire()
+                try:
+                    await bot.send_message(
+                        chat_id=subscriber_id,
+                        text=broadcast_message,
+                        parse_mode='HTML'
+                    )
+                    return True
+                except RetryAfter as e:
+                    # Flood control: hold back all pending sends, then retry this one
+                    logger.warning(f"Broadcast rate limited, retrying after {e.retry_after}s")
+                    limiter.pause(e.retry_after)
+                except Exception as e:
+                    logger.warning(f"Failed to send broadcast to {subscriber_id}: {e}")
+                    return False
+            return False
 
-    return get_text(chat_id, 'broadcast_success', success=success_count, total=total)
+    results = await asyncio.gather(
+        *(send_one(subscriber_id) for subscriber_id in all_subscribers),
+        return_exceptions=True
+    )
+    success_count = sum(1 for result in results if result is True)
 
+    return get_text(ctx, 'broadcast_success', success=success_count, total=total)
 
-async def handle_films_command(bot: Bot, chat_id: int) -> None:
+
+async def handle_films_command(bot: Bot, ctx: UserContext) -> None:
     """
     Handle /films command - show cinema source selection.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
     """
     try:
         # Show source selection buttons
-        keyboard = []
-        for source_id, source in CINEMA_SOURCES.items():
-            button_text = f"🎬 {source['display_name']}"
-            callback_data = f"films_source:{source_id}"
-            keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
-
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
         await bot.send_message(
-            chat_id=chat_id,
-            text=get_text(chat_id, 'films_select_source'),
+            chat_id=ctx.chat_id,
+            text=get_text(ctx, 'films_select_source'),
             parse_mode='HTML',
-            reply_markup=reply_markup
+            reply_markup=_FILMS_SOURCE_KEYBOARD
         )
         logger.debug("Sent cinema source selection for films")
 
     except Exception as e:
         logger.error(f"Error in handle_films_command: {e}", exc_info=True)
         await bot.send_message(
-            chat_id=chat_id,
-            text=get_text(chat_id, 'films_error')
+            chat_id=ctx.chat_id,
+            text=get_text(ctx, 'films_error')
         )
 
 
-async def handle_films_list(bot: Bot, chat_id: int, source_id: str) -> None:
+# (source_id, language) -> (films list, header, markup); rebuilt when the films list changes
+_films_list_messages: dict = {}
+
+
+def build_films_list_message(ctx: UserContext, source_id: str, films: List[Film]) -> tuple:
+    """
+    Get the header text and film keyboard for a source's films list.
+
+    The result only depends on the films list and the user's language, so it is
+    built once per cache refresh and shared by all users with that language.
+
+    Args:
+        ctx: User context (only the language is used)
+        source_id: Cinema source ID
+        films: Current films of the source
+
+    Returns:
+        (header, InlineKeyboardMarkup) tuple
+    """
+    cache_key = (source_id, ctx.language)
+    cached = _films_list_messages.get(cache_key)
+    if cached is not None and cached[0] is films:
+        return cached[1], cached[2]
+
+    source_name = CINEMA_SOURCES[source_id]['display_name']
+    header = get_text(ctx, 'films_title_source', source_name=source_name, count=len(films))
+
+    # Create inline keyboard with film buttons
+    keyboard = []
+    for i, film in enumerate(films):
+        # Create button text with emoji and age rating
+        age_rating = ""
+        if film.fsk_rating:
+            # Extract age number from FSK rating (e.g., "FSK: 6" -> "6+")
+            fsk_text = film.fsk_rating.replace("FSK:", "").replace("FSK", "").strip()
+            if fsk_text and fsk_text[0].isdigit():
+                age_rating = f" ({fsk_text}+)"
+
+        button_text = f"🎥 {film.title}{age_rating}"
+        # Use source-specific callback data
+        callback_data = f"film_{source_id}_{film.film_id}" if film.film_id else f"film_{source_id}_{i}"
+        keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
+
+    # Add back button
+    keyboard.append([InlineKeyboardButton(get_text(ctx, 'back_to_sources'), callback_data='back_to_film_sources')])
+
+    reply_markup = InlineKeyboardMarkup(keyboard)
+    _films_list_messages[cache_key] = (films, header, reply_markup)
+    return header, reply_markup
+
+
+async def handle_films_list(bot: Bot, ctx: UserContext, source_id: str) -> None:
     """
     Handle showing film list for a specific source.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
         source_id: Cinema source ID
     """
     try:
-        logger.debug(f"Fetching films for source: {source_id}")
-        films = fetch_current_films(source_id)
+        logger.debug("Fetching films for source: %s", source_id)
+        films = await fetch_current_films(source_id)
 
         if not films:
             await bot.send_message(
-                chat_id=chat_id,
-                text=get_text(chat_id, 'films_error')
+                chat_id=ctx.chat_id,
+                text=get_text(ctx, 'films_error')
             )
             return
 
-        # Get source display name
-        source_name = CINEMA_SOURCES[source_id]['display_name']
-
-        # Send header message in user's language
-        header = get_text(chat_id, 'films_title_source', source_name=source_name, count=len(films))
-
-        # Create inline keyboard with film buttons
-        keyboard = []
-        for i, film in enumerate(films):
-            # Create button text with emoji and age rating
-            age_rating = ""
-            if film.fsk_rating:
-                # Extract age number from FSK rating (e.g., "FSK: 6" -> "6+")
-                fsk_text = film.fsk_rating.replace("FSK:", "").replace("FSK", "").strip()
-                if fsk_text and fsk_text[0].isdigit():
-                    age_rating = f" ({fsk_text}+)"
-
-            button_text = f"🎥 {film.title}{age_rating}"
-            # Use source-specific callback data
-            callback_data = f"film_{source_id}_{film.film_id}" if film.film_id else f"film_{source_id}_{i}"
-            keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
-
-        # Add back button
-        keyboard.append([InlineKeyboardButton(get_text(chat_id, 'back_to_sources'), callback_data='back_to_film_sources')])
-
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        header, reply_markup = build_films_list_message(ctx, source_id, films)
 
         await bot.send_message(
-            chat_id=chat_id,
+            chat_id=ctx.chat_id,
             text=header,
             parse_mode='HTML',
             reply_markup=reply_markup
         )
-        logger.debug(f"Sent films list with {len(films)} films from {source_name}")
+        logger.debug("Sent films list with %d films from %s", len(films), source_id)
 
     except Exception as e:
         logger.error(f"Error in handle_films_list: {e}", exc_info=True)
         await bot.send_message(
-            chat_id=chat_id,
-            text=get_text(chat_id, 'films_error')
+            chat_id=ctx.chat_id,
+            text=get_text(ctx, 'films_error')
+        )
+
+
+def build_film_caption(ctx: UserContext, film: Film) -> str:
+    """Format the film details caption in the user's language."""
+    parts = [f"🎬 <b>{film.title}</b>\n\n"]
+
+    if film.genres:
+        parts.append(f"🎭 {', '.join(film.genres)}\n")
+    if film.fsk_rating:
+        parts.append(f"👤 {film.fsk_rating}\n")
+    if film.duration:
+        parts.append(f"⏱ {film.duration} {get_text(ctx, 'duration_min')}\n")
+
+    parts.append("\n")
+
+    if film.description:
+        desc = film.description
+        # Telegram photo caption limit is 1024 chars — leave room for showtimes
+        if len(desc) > MAX_DESCRIPTION_LENGTH:
+            desc = desc[:MAX_DESCRIPTION_LENGTH - 3] + "..."
+        parts.append(f"{desc}\n\n")
+
+    if film.showtimes:
+        parts.append(f"{get_text(ctx, 'showtimes')}\n")
+        # Limit to first 10 showtimes
+        parts.extend(
+            f"• {st.date} {st.time} - {st.room}{f' ({st.language})' if st.language else ''}\n"
+            for st in film.showtimes[:10]
         )
 
+        if len(film.showtimes) > 10:
+            parts.append(f"\n{get_text(ctx, 'more_showtimes', count=len(film.showtimes) - 10)}")
+
+    return "".join(parts)
+
 
-async def handle_film_details_callback(bot: Bot, chat_id: int, film_data: str) -> None:
+# (source_id, language) -> (films list, {id(film): caption}); dropped when the films list changes
+_film_captions: dict = {}
+
+
+def get_film_caption(ctx: UserContext, source_id: str, films: List[Film], film: Film) -> str:
+    """
+    Get the details caption for a film, rendering it once per films list and language.
+
+    Args:
+        ctx: User context (only the language is used)
+        source_id: Cinema source ID
+        films: Current films of the source (the cache is tied to this list)
+        film: Film from ``films``
+
+    Returns:
+        HTML caption
+    """
+    cache_key = (source_id, ctx.language)
+    cached = _film_captions.get(cache_key)
+    if cached is None or cached[0] is not films:
+        # The list keeps its films alive, so id(film) is stable while the entry exists
+        cached = (films, {})
+        _film_captions[cache_key] = cached
+
+    captions = cached[1]
+    caption = captions.get(id(film))
+    if caption is None:
+        caption = captions[id(film)] = build_film_caption(ctx, film)
+    return caption
+
+
+async def handle_film_details_callback(bot: Bot, ctx: UserContext, film_data: str) -> None:
     """
     Handle callback query for film details.
 
     Args:
         bot: Bot instance
-        chat_id: User's chat ID
+        ctx: User context (chat ID, language, subscriptions)
         film_data: Film data in format "source_id_film_id" or just "film_id" (legacy)
     """
     try:
-        logger.debug(f"Fetching details for film_data: {film_data}")
+        logger.debug("Fetching details for film_data: %s", film_data)
 
         # Parse source_id and film_id from callback data
         # New format: "meisengeige_123" or "kinderkino_5"
@@ -961,63 +1581,34 @@ async def handle_film_details_callback(bot: Bot, chat_id: int, film_data: str) -
             source_id = 'meisengeige'
             film_id = film_data
 
-        films = fetch_current_films(source_id)
+        films = await fetch_current_films(source_id)
 
-        # Find the requested film
-        film = None
-        for i, f in enumerate(films):
-            if f.film_id == film_id or str(i) == film_id:
-                film = f
-                break
+        # Find the requested film: by film_id, else by list position
+        film = get_film_index(source_id, films).get(film_id)
+        if film is None and film_id.isdigit() and int(film_id) < len(films):
+            film = films[int(film_id)]
 
         if not film:
             await bot.send_message(
-                chat_id=chat_id,
-                text=get_text(chat_id, 'film_not_found')
+                chat_id=ctx.chat_id,
+                text=get_text(ctx, 'film_not_found')
             )
             return
 
-        # Format film details
-        caption = f"🎬 <b>{film.title}</b>\n\n"
-
-        if film.genres:
-            caption += f"🎭 {', '.join(film.genres)}\n"
-        if film.fsk_rating:
-            caption += f"👤 {film.fsk_rating}\n"
-        if film.duration:
-            caption += f"⏱ {film.duration} {get_text(chat_id, 'duration_min')}\n"
-
-        caption += "\n"
-
-        if film.description:
-            desc = film.description
-            # Telegram photo caption limit is 1024 chars — leave room for showtimes
-            max_desc = MAX_DESCRIPTION_LENGTH
-            if len(desc) > max_desc:
-                desc = desc[:max_desc - 3] + "..."
-            caption += f"{desc}\n\n"
-
-        if film.showtimes:
-            caption += f"{get_text(chat_id, 'showtimes')}\n"
-            # Group showtimes by date
-            for showtime in film.showtimes[:10]:  # Limit to first 10 showtimes
-                lang_info = f" ({showtime.language})" if showtime.language else ""
-                caption += f"• {showtime.date} {showtime.time} - {showtime.room}{lang_info}\n"
-
-            if len(film.showtimes) > 10:
-                caption += f"\n{get_text(chat_id, 'more_showtimes', count=len(film.showtimes) - 10)}"
+        caption = get_film_caption(ctx, source_id, films, film)
 
         # Create back button with translation
-        back_button_text = get_text(chat_id, 'back_to_list')
+        back_button_text = get_text(ctx, 'back_to_list')
         keyboard = [[InlineKeyboardButton(back_button_text, callback_data=f"back_to_list:{source_id}")]]
         reply_markup = InlineKeyboardMarkup(keyboard)
 
         # Send photo with details
         if film.poster_url:
             try:
-                await bot.send_photo(
-                    chat_id=chat_id,
-                    photo=film.poster_url,
+                await send_cached_photo(
+                    bot,
+                    ctx.chat_id,
+                    film.poster_url,
                     caption=caption,
                     parse_mode='HTML',
                     reply_markup=reply_markup
@@ -1025,29 +1616,160 @@ async def handle_film_details_callback(bot: Bot, chat_id: int, film_data: str) -
             except TelegramError:
                 # Fallback if photo/caption fails (e.g. caption too long, invalid URL)
                 await bot.send_message(
-                    chat_id=chat_id,
+                    chat_id=ctx.chat_id,
                     text=caption,
                     parse_mode='HTML',
                     reply_markup=reply_markup
                 )
         else:
             await bot.send_message(
-                chat_id=chat_id,
+                chat_id=ctx.chat_id,
                 text=caption,
                 parse_mode='HTML',
                 reply_markup=reply_markup
             )
 
-        logger.debug(f"Sent details for film: {film.title}")
+        logger.debug("Sent details for film: %s", film.title)
 
     except Exception as e:
         logger.error(f"Error in handle_film_details_callback: {e}", exc_info=True)
         await bot.send_message(
-            chat_id=chat_id,
-            text=get_text(chat_id, 'film_details_error')
+            chat_id=ctx.chat_id,
+            text=get_text(ctx, 'film_details_error')
         )
 
 
+async def handle_language_selected_callback(bot: Bot, query, ctx: UserContext, lang: str) -> None:
+    """Handle first-time language selection (lang_ callback) and send the welcome."""
+    await handle_language_changed_callback(bot, query, ctx, lang)
+
+    # Send welcome message without auto-subscribing
+    user_first_name = query.from_user.first_name or "there"
+    await send_welcome_message(bot, ctx, user_first_name)
+
+
+async def handle_language_changed_callback(bot: Bot, query, ctx: UserContext, lang: str) -> None:
+    """Handle a language change (changelang_ callback from /language)."""
+    # Save the preference and set the user-specific command menu in their language;
+    # the confirmation is only sent once the write is acknowledged
+    await asyncio.gather(
+        user_manager.set_language(ctx.chat_id, lang),
+        set_user_commands(bot, ctx.chat_id, lang)
+    )
+    ctx.language = lang
+    ctx.language_set = True
+
+    # Send confirmation message in the newly selected language
+    await bot.send_message(
+        chat_id=ctx.chat_id,
+        text=get_text(ctx, 'language_set')
+    )
+
+
+async def handle_film_callback(bot: Bot, query, ctx: UserContext, film_data: str) -> None:
+    """Handle a film_ callback - show film details."""
+    await handle_film_details_callback(bot, ctx, film_data)
+
+
+async def handle_source_films_callback(bot: Bot, query, ctx: UserContext, source_id: str) -> None:
+    """Handle films_source:/back_to_list: callbacks - show the source's film list."""
+    if source_id in CINEMA_SOURCES:
+        await handle_films_list(bot, ctx, source_id)
+    else:
+        await bot.send_message(chat_id=ctx.chat_id, text=get_text(ctx, 'unknown_source'))
+
+
+async def handle_back_to_sources_callback(bot: Bot, query, ctx: UserContext, _: str) -> None:
+    """Handle back_to_film_sources - return to source selection."""
+    await handle_films_command(bot, ctx)
+
+
+async def handle_subscribe_callback(bot: Bot, query, ctx: UserContext, source_id: str) -> None:
+    """Handle a sub: callback - subscribe to a source."""
+    if source_id not in CINEMA_SOURCES:
+        await bot.answer_callback_query(query.id, text=get_text(ctx, 'unknown_source'))
+        return
+
+    source_name = CINEMA_SOURCES[source_id]['display_name']
+    try:
+        added = await user_manager.add_subscription(ctx.chat_id, source_id)
+    except Exception as e:
+        logger.error(f"Error subscribing {ctx.chat_id} to {source_id}: {e}")
+        message = get_text(ctx, 'subscription_error')
+    else:
+        # The write succeeded either way, so the source is now saved
+        if source_id not in ctx.sources:
+            ctx.sources.append(source_id)
+        message_key = 'subscribed_to_source' if added else 'already_subscribed_source'
+        message = get_text(ctx, message_key, source_name=source_name)
+    await answer_subscription_toggle(bot, query, ctx, message)
+
+
+async def handle_unsubscribe_callback(bot: Bot, query, ctx: UserContext, source_id: str) -> None:
+    """Handle an unsub: callback - unsubscribe from a source."""
+    if source_id not in CINEMA_SOURCES:
+        await bot.answer_callback_query(query.id, text=get_text(ctx, 'unknown_source'))
+        return
+
+    source_name = CINEMA_SOURCES[source_id]['display_name']
+    try:
+        removed = await user_manager.remove_subscription(ctx.chat_id, source_id)
+    except Exception as e:
+        logger.error(f"Error unsubscribing {ctx.chat_id} from {source_id}: {e}")
+        message = get_text(ctx, 'subscription_error')
+    else:
+        # The write succeeded either way, so the source is no longer saved
+        if source_id in ctx.sources:
+            ctx.sources.remove(source_id)
+        message_key = 'unsubscribed_from_source' if removed else 'not_subscribed_source'
+        message = get_text(ctx, message_key, source_name=source_name)
+    await answer_subscription_toggle(bot, query, ctx, message)
+
+
+# Callback routing. Handlers take (bot, query, ctx, argument), where argument is the
+# callback data after the prefix. The flag marks handlers that answer the query themselves.
+CALLBACK_EXACT_HANDLERS = {
+    'back_to_film_sources': (handle_back_to_sources_callback, False),
+}
+CALLBACK_PREFIX_HANDLERS = (
+    ('lang_', handle_language_selected_callback, False),
+    ('changelang_', handle_language_changed_callback, False),
+    ('film_', handle_film_callback, False),
+    ('films_source:', handle_source_films_callback, False),
+    ('back_to_list:', handle_source_films_callback, False),
+    ('sub:', handle_subscribe_callback, True),
+    ('unsub:', handle_unsubscribe_callback, True),
+)
+
+
+def match_callback(callback_data: str) -> tuple:
+    """
+    Find the handler for callback data.
+
+    Returns:
+        (handler, argument, answers_query) - handler is None for unknown callbacks
+    """
+    entry = CALLBACK_EXACT_HANDLERS.get(callback_data)
+    if entry is not None:
+        return entry[0], '', entry[1]
+    for prefix, handler_fn, answers_query in CALLBACK_PREFIX_HANDLERS:
+        if callback_data.startswith(prefix):
+            return handler_fn, callback_data[len(prefix):], answers_query
+    return None, '', False
+
+
+# Commands whose handler takes only (bot, ctx): command -> (handler, reply parse_mode).
+# Handlers return the reply text, or None if they already sent their own message.
+# /start and /broadcast need extra arguments and are routed separately.
+COMMAND_HANDLERS = {
+    '/stop': (handle_stop_command, None),
+    '/status': (handle_status_command, 'HTML'),
+    '/language': (handle_language_command, None),
+    '/films': (handle_films_command, None),
+    '/sources': (handle_sources_command, None),
+}
+
+
 async def process_update(update_data: dict) -> dict:
     """
     Process incoming Telegram update.
@@ -1058,12 +1780,21 @@ async def process_update(update_data: dict) -> dict:
     Returns:
         Response dict
     """
+    # Skip updates we never handle (edited messages, channel posts, stickers...)
+    # before doing any setup or deserialization
+    message = update_data.get('message')
+    if 'callback_query' not in update_data and not (message and message.get('text')):
+        return {'status': 'ignored', 'reason': 'unsupported update type'}
+
     try:
-        # Create bot instance for this request
-        bot = Bot(token=BOT_TOKEN)
+        bot = get_bot()
 
-        # Initialize bot commands menu (runs only once per container)
-        await setup_bot_commands(bot)
+        # Initialize bot commands menu and DB indexes concurrently with handling the
+        # update; once done in this container no coroutine is even created
+        if time.time() - _commands_last_set >= _COMMANDS_CACHE_SECONDS:
+            run_in_background(setup_bot_commands(bot))
+        if not _indexes_ready:
+            run_in_background(ensure_indexes())
 
         update = Update.de_json(update_data, bot)
 
@@ -1073,95 +1804,19 @@ async def process_update(update_data: dict) -> dict:
             chat_id = query.message.chat.id
             callback_data = query.data
 
-            logger.debug(f"Processing callback query: '{callback_data}' from chat_id: {chat_id}")
-
-            # Answer callback query to remove loading state
-            await bot.answer_callback_query(query.id)
-
-            # Handle callbacks
-            if callback_data.startswith('lang_'):
-                # Language selection
-                lang = callback_data.replace('lang_', '')
-                language_manager.set_language(chat_id, lang)
-
-                # Set user-specific command menu in their language
-                await set_user_commands(bot, chat_id, lang)
-
-                # Send confirmation message
-                await bot.send_message(
-                    chat_id=chat_id,
-                    text=get_text(chat_id, 'language_set')
-                )
-
-                # Send welcome message without auto-subscribing
-                user = query.from_user
-                user_first_name = user.first_name or "there"
-                await send_welcome_message(bot, chat_id, user_first_name)
+            logger.debug("Processing callback query: '%s' from chat_id: %s", callback_data, chat_id)
 
-            elif callback_data.startswith('changelang_'):
-                # Language change (from /language command)
-                lang = callback_data.replace('changelang_', '')
-                language_manager.set_language(chat_id, lang)
+            handler_fn, argument, answers_query = match_callback(callback_data)
 
-                # Set user-specific command menu in their language
-                await set_user_commands(bot, chat_id, lang)
+            # Answer callback query to remove loading state, concurrently with the
+            # handler (sub:/unsub: answer later with a confirmation toast instead)
+            if not answers_query:
+                run_in_background(bot.answer_callback_query(query.id))
 
-                # Send confirmation message in the newly selected language
-                await bot.send_message(
-                    chat_id=chat_id,
-                    text=get_text(chat_id, 'language_set')
-                )
+            ctx = await get_user_context(chat_id)
 
-            elif callback_data.startswith('film_'):
-                # Show film details
-                film_data = callback_data.replace('film_', '')
-                await handle_film_details_callback(bot, chat_id, film_data)
-
-            elif callback_data.startswith('films_source:'):
-                # Show film list for selected source
-                source_id = callback_data.replace('films_source:', '')
-                if source_id in CINEMA_SOURCES:
-                    await handle_films_list(bot, chat_id, source_id)
-                else:
-                    await bot.send_message(chat_id=chat_id, text=get_text(chat_id, 'unknown_source'))
-
-            elif callback_data == 'back_to_film_sources':
-                # Return to source selection
-                await handle_films_command(bot, chat_id)
-
-            elif callback_data.startswith('back_to_list:'):
-                # Return to films list for specific source
-                source_id = callback_data.replace('back_to_list:', '')
-                if source_id in CINEMA_SOURCES:
-                    await handle_films_list(bot, chat_id, source_id)
-                else:
-                    await bot.send_message(chat_id=chat_id, text=get_text(chat_id, 'unknown_source'))
-
-            elif callback_data.startswith('sub:'):
-                # Subscribe to source
-                source_id = callback_data.replace('sub:', '')
-                if source_id in CINEMA_SOURCES:
-                    source = CINEMA_SOURCES[source_id]
-                    if subscriber_manager.add_subscription(chat_id, source_id):
-                        message = get_text(chat_id, 'subscribed_to_source', source_name=source['display_name'])
-                    else:
-                        message = get_text(chat_id, 'already_subscribed_source', source_name=source['display_name'])
-                    await bot.send_message(chat_id=chat_id, text=message)
-                else:
-                    await bot.send_message(chat_id=chat_id, text=get_text(chat_id, 'unknown_source'))
-
-            elif callback_data.startswith('unsub:'):
-                # Unsubscribe from source
-                source_id = callback_data.replace('unsub:', '')
-                if source_id in CINEMA_SOURCES:
-                    source = CINEMA_SOURCES[source_id]
-                    if subscriber_manager.remove_subscription(chat_id, source_id):
-                        message = get_text(chat_id, 'unsubscribed_from_source', source_name=source['display_name'])
-                    else:
-                        message = get_text(chat_id, 'not_subscribed_source', source_name=source['display_name'])
-                    await bot.send_message(chat_id=chat_id, text=message)
-                else:
-                    await bot.send_message(chat_id=chat_id, text=get_text(chat_id, 'unknown_source'))
+            if handler_fn is not None:
+                await handler_fn(bot, query, ctx, argument)
 
             return {'status': 'success', 'type': 'callback_query'}
 
@@ -1173,50 +1828,37 @@ async def process_update(update_data: dict) -> dict:
         text = update.message.text.strip()
         user_first_name = update.message.from_user.first_name or "there"
 
-        logger.debug(f"Processing command: '{text}' from chat_id: {chat_id}")
+        logger.debug("Processing command: '%s' from chat_id: %s", text, chat_id)
+
+        ctx = await get_user_context(chat_id)
 
         # Check and notify about version updates (for subscribed users)
-        # await check_and_notify_version_update(bot, chat_id)
+        # await check_and_notify_version_update(bot, ctx)
 
         # Route command (only slash commands)
         response_text = None
         parse_mode = None
 
-        if text == '/start':
+        entry = COMMAND_HANDLERS.get(text)
+        if entry is not None:
+            command_handler, parse_mode = entry
+            logger.debug("Routing to %s", command_handler.__name__)
+            response_text = await command_handler(bot, ctx)
+        elif text == '/start':
             logger.debug("Routing to handle_start_command")
-            response_text = await handle_start_command(bot, chat_id, user_first_name)
-        elif text == '/stop':
-            logger.debug("Routing to handle_stop_command")
-            response_text = await handle_stop_command(bot, chat_id)
-        elif text == '/status':
-            logger.debug("Routing to handle_status_command")
-            response_text = await handle_status_command(bot, chat_id)
-            parse_mode = 'HTML'
-            logger.debug(f"Response text: {response_text[:50]}...")
-        elif text == '/language':
-            logger.debug("Routing to handle_language_command")
-            await handle_language_command(bot, chat_id)
-            return {'status': 'success', 'command': text}
-        elif text == '/films':
-            logger.debug("Routing to handle_films_command")
-            await handle_films_command(bot, chat_id)
-            return {'status': 'success', 'command': text}
-        elif text == '/sources':
-            logger.debug("Routing to handle_sources_command")
-            await handle_sources_command(bot, chat_id)
-            return {'status': 'success', 'command': text}
+            response_text = await handle_start_command(bot, ctx, user_first_name)
         elif text.startswith('/broadcast'):
             logger.debug("Routing to handle_broadcast_command")
-            response_text = await handle_broadcast_command(bot, chat_id, text)
+            response_text = await handle_broadcast_command(bot, ctx, text)
         else:
             # Unknown command
-            logger.debug(f"Unknown command: {text}")
-            response_text = get_text(chat_id, 'unknown_command')
+            logger.debug("Unknown command: %s", text)
+            response_text = get_text(ctx, 'unknown_command')
 
         # Send response (only if response_text is not None)
         # Some handlers (like first-time /start or /films) send their own messages and return None
         if response_text:
-            logger.debug(f"Sending response with parse_mode={parse_mode}")
+            logger.debug("Sending response with parse_mode=%s", parse_mode)
             await bot.send_message(
                 chat_id=chat_id,
                 text=response_text,
@@ -1234,11 +1876,29 @@ async def process_update(update_data: dict) -> dict:
     except Exception as e:
         logger.error(f"Error processing update: {e}", exc_info=True)
         return {'status': 'error', 'error': str(e)}
+    finally:
+        # do_POST only responds after this returns, so background work (setup, callback
+        # answers, writes, film refreshes) always finishes within the invocation
+        await drain_background_tasks()
 
 
 # Vercel serverless function handler
 from http.server import BaseHTTPRequestHandler
 
+# One event loop per process. The shared Mongo, HTTP and Bot clients are bound
+# to the loop they were first used on, so it must outlive a single request
+# (asyncio.run would close it after every update).
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop used to run updates (lazy init)."""
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+    return _event_loop
+
 
 class handler(BaseHTTPRequestHandler):
     """Main handler for Vercel serverless function."""
@@ -1252,47 +1912,40 @@ class handler(BaseHTTPRequestHandler):
             json.dumps({'status': 'healthy', 'bot': 'nuernberg-kino-bot'}).encode()
         )
 
+    def _send_json(self, status: int, payload: dict) -> None:
+        """Write a complete JSON response (with Content-Length)."""
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+
     def do_POST(self):
         """Handle POST requests (webhook)."""
         try:
             # Read body
             content_length = int(self.headers.get('Content-Length', 0))
             body = self.rfile.read(content_length)
-            data = json.loads(body.decode('utf-8'))
-
-            if not data:
-                self.send_response(400)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(
-                    json.dumps({'status': 'error', 'message': 'No data'}).encode()
-                )
-                return
-
-            # Process update with proper event loop handling
-            import asyncio
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            result = loop.run_until_complete(process_update(data))
+            data = json.loads(body)
+        except Exception as e:
+            logger.error(f"Handler error: {e}", exc_info=True)
+            self._send_json(500, {'status': 'error', 'message': str(e)})
+            return
 
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+        if not data:
+            self._send_json(400, {'status': 'error', 'message': 'No data'})
+            return
 
+        # Respond only after the update is fully processed (including the background
+        # tasks drained by process_update): the platform may freeze the instance as
+        # soon as the response is complete, so no work may outlive it
+        try:
+            result = get_event_loop().run_until_complete(process_update(data))
         except Exception as e:
             logger.error(f"Handler error: {e}", exc_info=True)
+            self._send_json(500, {'status': 'error', 'message': str(e)})
+            return
 
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(
-                json.dumps({'status': 'error', 'message': str(e)}).encode()
-            )
+        self._send_json(200, result)
@@ -1,7 +1,7 @@
 """Base class for cinema program scrapers."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 import httpx
 
 from .models import Film
@@ -12,17 +12,33 @@ class BaseCinemaScraper(ABC):
 
     TIMEOUT = 30.0
 
-    def __init__(self):
-        """Initialize the scraper with HTTP client."""
-        self.client = httpx.Client(timeout=self.TIMEOUT)
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the scraper.
 
-    def __enter__(self):
-        """Context manager entry."""
+        Args:
+            client: Shared HTTP client to reuse. If omitted, a private client is
+                created on first request and closed on context exit.
+        """
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client (created lazily so metadata-only use opens no connections)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.TIMEOUT)
+        return self._client
+
+    async def __aenter__(self):
+        """Async context manager entry."""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close HTTP client."""
-        self.client.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close HTTP client if we own it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     @abstractmethod
     def get_source_id(self) -> str:
@@ -55,7 +71,7 @@ class BaseCinemaScraper(ABC):
         pass
 
     @abstractmethod
-    def scrape(self) -> List[Film]:
+    async def scrape(self) -> List[Film]:
         """
         Scrape and return films from source.
 
@@ -1,17 +1,63 @@
 """Web scraper for Filmhaus Kinderkino program."""
 
+import asyncio
+import logging
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+import httpx
 from bs4 import BeautifulSoup
 
 from .base_scraper import BaseCinemaScraper
 from .models import Film, Showtime
 
+logger = logging.getLogger(__name__)
+
+# Listing card patterns, compiled once instead of per card / showtime
+_DATE_RE = re.compile(r'\d{2}\.\d{2}\.\d{4}')
+_VENUE_RE = re.compile(r'Filmhaus')
+_DATETIME_RE = re.compile(r'(\w+)\s*/\s*(\d{2}\.\d{2}\.?\d*)\s*/\s*(\d{2}:\d{2})')
+
+# Detail page metadata, compiled once instead of on every detail page
+_DETAIL_DURATION_RE = re.compile(r'Länge:\s*(\d+)\s*Min', re.IGNORECASE)
+_DETAIL_FSK_RE = re.compile(r'FSK:\s*ab\s*(\d+)', re.IGNORECASE)
+_DETAIL_GENRE_RE = re.compile(
+    r'(Animation|Dokumentarfilm|Drama|Komödie|Thriller|Action|Fantasy|Abenteuer)'
+    r'(?:\s|Land:|Länge:|$)',
+    re.IGNORECASE,
+)
+_DETAIL_COUNTRY_RE = re.compile(r'Land:\s*([^\n]+?)(?:Jahr:|Regie:|$)', re.IGNORECASE)
+_DETAIL_YEAR_RE = re.compile(r'Jahr:\s*(\d{4})')
+_DETAIL_DIRECTOR_RE = re.compile(
+    r'Regie:\s*([^\n]+?)(?:Animation|Länge:|Sprache:|$)', re.IGNORECASE
+)
+
+
+def _absolute_url(url: str, page_url: str) -> str:
+    """Resolve a (possibly relative) link against the URL of the page it was found on."""
+    if url.startswith(('http://', 'https://')):
+        return url
+    return urljoin(page_url, url)
+
 
 class FilmhausScraper(BaseCinemaScraper):
     """Scraper for Filmhaus Kinderkino program page."""
 
     BASE_URL = "https://www.kunstkulturquartier.de/filmhaus/programm/kinderkino"
+    DETAIL_CONCURRENCY = 8  # parallel detail page requests per scrape
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, detail_cache=None):
+        """
+        Initialize the scraper.
+
+        Args:
+            client: Shared HTTP client to reuse (see BaseCinemaScraper)
+            detail_cache: Optional cache for parsed detail pages. Must provide
+                ``async load(urls) -> Dict[str, dict]`` and ``async store(url, info)``.
+                Cached pages are not fetched again.
+        """
+        super().__init__(client)
+        self.detail_cache = detail_cache
 
     def get_source_id(self) -> str:
         """Return unique source identifier."""
@@ -25,7 +71,7 @@ class FilmhausScraper(BaseCinemaScraper):
         """Return program page URL."""
         return self.BASE_URL
 
-    def scrape(self) -> List[Film]:
+    async def scrape(self) -> List[Film]:
         """
         Scrape the Kinderkino program page and return list of films.
 
@@ -35,43 +81,64 @@ class FilmhausScraper(BaseCinemaScraper):
         Raises:
             httpx.HTTPError: If request fails
         """
-        response = self.client.get(self.BASE_URL)
+        response = await self.client.get(self.BASE_URL)
         response.raise_for_status()
-        return self.parse_films(response.text)
+        events = await asyncio.to_thread(self.parse_events, response.content)
+
+        cached_details = await self._load_cached_details(
+            [detail_url for _, detail_url in events if detail_url]
+        )
 
-    def parse_films(self, html: str) -> List[Film]:
+        # Detail pages are independent - fetch them concurrently, a few at a time
+        semaphore = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+
+        async def enrich(film: Film, detail_url: str) -> None:
+            detail_info = cached_details.get(detail_url)
+            if detail_info is not None:
+                self._apply_detail(film, detail_info)
+                return
+            async with semaphore:
+                await self._enrich_from_detail(film, detail_url)
+
+        await asyncio.gather(*(
+            enrich(film, detail_url) for film, detail_url in events if detail_url
+        ))
+
+        return [film for film, _ in events]
+
+    def parse_events(self, html: Union[str, bytes]) -> List[Tuple[Film, Optional[str]]]:
         """
-        Parse films from HTML content.
+        Parse events from listing HTML.
 
         Args:
-            html: HTML content as string
+            html: HTML content as string or raw bytes
 
         Returns:
-            List of Film objects
+            List of (Film, detail page URL) pairs; films are not yet enriched
+            with detail page information
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Find event cards - they have 'kachel' class
         cards = soup.find_all('div', class_='kachel')
 
-        films = []
+        events = []
         for card in cards:
-            film = self._parse_single_event(card)
-            if film:
-                films.append(film)
+            event = self._parse_single_event(card)
+            if event:
+                events.append(event)
 
-        return films
+        return events
 
-    def _parse_single_event(self, card) -> Optional[Film]:
+    def _parse_single_event(self, card) -> Optional[Tuple[Film, Optional[str]]]:
         """
         Parse a single event from its container element.
-        Fetches detail page for enriched information.
 
         Args:
             card: BeautifulSoup element containing event data
 
         Returns:
-            Film object or None if parsing fails
+            (Film, detail page URL) pair or None if parsing fails
         """
         try:
             # Extract title and detail URL from detailLink
@@ -85,27 +152,20 @@ class FilmhausScraper(BaseCinemaScraper):
             poster_url = None
             img = card.find('img')
             if img and img.get('src'):
-                poster_url = img['src']
-                if not poster_url.startswith('http'):
-                    poster_url = (
-                        f"https://www.kunstkulturquartier.de{poster_url}"
-                        if poster_url.startswith('/')
-                        else poster_url
-                    )
+                poster_url = _absolute_url(img['src'], self.BASE_URL)
 
             # Extract date/time and venue information
             date_time_text = None
             venue = "Filmhaus Nürnberg"
 
-            # Look for text containing date pattern (e.g., "Mo / 22.12.2025 / 15:00 Uhr")
-            for text_elem in card.find_all(string=True):
-                text = text_elem.strip()
-                if re.search(r'\d{2}\.\d{2}\.\d{4}', text):
-                    date_time_text = text
-                    break
+            # Look for text containing date pattern (e.g., "Mo / 22.12.2025 / 15:00 Uhr");
+            # find() stops at the first match instead of listing every text node
+            date_elem = card.find(string=_DATE_RE)
+            if date_elem:
+                date_time_text = date_elem.strip()
 
             # Try to extract venue more precisely if available
-            venue_div = card.find('div', string=re.compile(r'Filmhaus'))
+            venue_div = card.find('div', string=_VENUE_RE)
             if venue_div:
                 venue_text = venue_div.get_text(strip=True)
                 if venue_text:
@@ -117,132 +177,153 @@ class FilmhausScraper(BaseCinemaScraper):
                 if showtime:
                     showtimes.append(showtime)
 
-            # Fetch detail page for enriched information
-            description = None
-            fsk_rating = None
-            duration = None
-            genres = ["Kinderkino"]
-
             if detail_url:
-                try:
-                    full_detail_url = (
-                        f"https://www.kunstkulturquartier.de{detail_url}"
-                        if detail_url.startswith('/')
-                        else detail_url
-                    )
-                    detail_info = self._fetch_detail(full_detail_url)
-                    if detail_info:
-                        description = detail_info.get('description')
-                        fsk_rating = detail_info.get('fsk_rating')
-                        duration = detail_info.get('duration')
-                        if detail_info.get('genre'):
-                            genres = [detail_info['genre'], "Kinderkino"]
-                except Exception as e:
-                    print(f"Warning: Failed to fetch detail for {title}: {e}")
-
-            return Film(
+                detail_url = _absolute_url(detail_url, self.BASE_URL)
+
+            film = Film(
                 title=title,
-                genres=genres,
-                fsk_rating=fsk_rating,
-                duration=duration,
-                description=description,
+                genres=["Kinderkino"],
+                fsk_rating=None,
+                duration=None,
+                description=None,
                 poster_url=poster_url,
                 film_id=None,
                 showtimes=showtimes,
             )
+            return film, detail_url
 
         except Exception as e:
-            print(f"Error parsing Kinderkino event: {e}")
+            logger.warning("Error parsing Kinderkino event: %s", e)
             return None
 
-    def _fetch_detail(self, detail_url: str) -> Optional[dict]:
+    async def _enrich_from_detail(self, film: Film, detail_url: str) -> None:
+        """
+        Fill in description, FSK rating, duration and genre from the detail page.
+
+        Args:
+            film: Film to update in place
+            detail_url: Full URL to the detail page
+        """
+        try:
+            detail_info = await self._fetch_detail(detail_url)
+            if detail_info:
+                self._apply_detail(film, detail_info)
+                if self.detail_cache is not None:
+                    await self.detail_cache.store(detail_url, detail_info)
+        except Exception as e:
+            logger.warning("Failed to fetch detail for %s: %s", film.title, e)
+
+    async def _load_cached_details(self, urls: List[str]) -> Dict[str, dict]:
+        """Look up already parsed detail pages in one batch (empty without a cache)."""
+        if self.detail_cache is None or not urls:
+            return {}
+        try:
+            return await self.detail_cache.load(urls)
+        except Exception as e:
+            logger.warning("Failed to load cached Kinderkino details: %s", e)
+            return {}
+
+    @staticmethod
+    def _apply_detail(film: Film, detail_info: dict) -> None:
+        """Copy parsed detail page fields onto a film."""
+        film.description = detail_info.get('description')
+        film.fsk_rating = detail_info.get('fsk_rating')
+        film.duration = detail_info.get('duration')
+        if detail_info.get('genre'):
+            film.genres = [detail_info['genre'], "Kinderkino"]
+
+    async def _fetch_detail(self, detail_url: str) -> Optional[dict]:
         """
-        Fetch and parse Kinderkino detail page for additional film information.
+        Fetch Kinderkino detail page for additional film information.
 
         Args:
             detail_url: Full URL to the detail page
 
         Returns:
-            Dictionary with film details or None if parsing fails
+            Dictionary with film details or None if fetching/parsing fails
         """
         try:
-            response = self.client.get(detail_url, follow_redirects=True)
+            response = await self.client.get(detail_url, follow_redirects=True)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            return await asyncio.to_thread(self._parse_detail, response.content)
+        except Exception as e:
+            logger.warning("Error fetching detail page %s: %s", detail_url, e)
+            return None
 
-            main_content = soup.find('main')
-            if not main_content:
-                return None
+    def _parse_detail(self, html: Union[str, bytes]) -> Optional[dict]:
+        """
+        Parse Kinderkino detail page HTML.
 
-            # Extract full description (first paragraph that's not pricing)
-            description = None
-            for p in main_content.find_all('p'):
-                text = p.get_text(strip=True)
-                if text and 'Eintritt' not in text and len(text) > 50:
-                    description = text
-                    break
-
-            # Parse all metadata from the text
-            all_text = main_content.get_text() if main_content else ''
-
-            # Extract duration
-            duration = None
-            duration_match = re.search(r'Länge:\s*(\d+)\s*Min', all_text, re.IGNORECASE)
-            if duration_match:
-                duration = int(duration_match.group(1))
-
-            # Extract FSK rating
-            fsk_rating = None
-            fsk_match = re.search(r'FSK:\s*ab\s*(\d+)', all_text, re.IGNORECASE)
-            if fsk_match:
-                age = fsk_match.group(1)
-                fsk_rating = f"FSK: {age}"
-
-            # Extract genre
-            genre = None
-            genre_match = re.search(
-                r'(Animation|Dokumentarfilm|Drama|Komödie|Thriller|Action|Fantasy|Abenteuer)'
-                r'(?:\s|Land:|Länge:|$)',
-                all_text,
-                re.IGNORECASE,
-            )
-            if genre_match:
-                genre = genre_match.group(1)
-
-            # Extract country
-            country = None
-            country_match = re.search(r'Land:\s*([^\n]+?)(?:Jahr:|Regie:|$)', all_text, re.IGNORECASE)
-            if country_match:
-                country = country_match.group(1).strip()
-
-            # Extract year
-            year = None
-            year_match = re.search(r'Jahr:\s*(\d{4})', all_text)
-            if year_match:
-                year = year_match.group(1)
-
-            # Extract director
-            director = None
-            director_match = re.search(
-                r'Regie:\s*([^\n]+?)(?:Animation|Länge:|Sprache:|$)', all_text, re.IGNORECASE
-            )
-            if director_match:
-                director = director_match.group(1).strip()
-
-            return {
-                'description': description,
-                'duration': duration,
-                'fsk_rating': fsk_rating,
-                'genre': genre,
-                'country': country,
-                'year': year,
-                'director': director,
-            }
+        Args:
+            html: Detail page HTML as string or raw bytes
 
-        except Exception as e:
-            print(f"Error fetching detail page {detail_url}: {e}")
+        Returns:
+            Dictionary with film details or None if parsing fails
+        """
+        soup = BeautifulSoup(html, 'lxml')
+
+        main_content = soup.find('main')
+        if not main_content:
             return None
 
+        # Extract full description (first paragraph that's not pricing)
+        description = None
+        for p in main_content.find_all('p'):
+            text = p.get_text(strip=True)
+            if text and 'Eintritt' not in text and len(text) > 50:
+                description = text
+                break
+
+        # Parse all metadata from the text
+        all_text = main_content.get_text() if main_content else ''
+
+        # Extract duration
+        duration = None
+        duration_match = _DETAIL_DURATION_RE.search(all_text)
+        if duration_match:
+            duration = int(duration_match.group(1))
+
+        # Extract FSK rating
+        fsk_rating = None
+        fsk_match = _DETAIL_FSK_RE.search(all_text)
+        if fsk_match:
+            age = fsk_match.group(1)
+            fsk_rating = f"FSK: {age}"
+
+        # Extract genre
+        genre = None
+        genre_match = _DETAIL_GENRE_RE.search(all_text)
+        if genre_match:
+            genre = genre_match.group(1)
+
+        # Extract country
+        country = None
+        country_match = _DETAIL_COUNTRY_RE.search(all_text)
+        if country_match:
+            country = country_match.group(1).strip()
+
+        # Extract year
+        year = None
+        year_match = _DETAIL_YEAR_RE.search(all_text)
+        if year_match:
+            year = year_match.group(1)
+
+        # Extract director
+        director = None
+        director_match = _DETAIL_DIRECTOR_RE.search(all_text)
+        if director_match:
+            director = director_match.group(1).strip()
+
+        return {
+            'description': description,
+            'duration': duration,
+            'fsk_rating': fsk_rating,
+            'genre': genre,
+            'country': country,
+            'year': year,
+            'director': director,
+        }
+
     def _parse_datetime(self, text: str, venue: str) -> Optional[Showtime]:
         """
         Parse date/time from Filmhaus format.
@@ -256,7 +337,7 @@ class FilmhausScraper(BaseCinemaScraper):
         """
         try:
             # Extract components: day / DD.MM.YYYY / HH:MM Uhr
-            match = re.search(r'(\w+)\s*/\s*(\d{2}\.\d{2}\.?\d*)\s*/\s*(\d{2}:\d{2})', text)
+            match = _DATETIME_RE.search(text)
             if not match:
                 return None
 
@@ -277,5 +358,5 @@ class FilmhausScraper(BaseCinemaScraper):
                 language=None,
             )
         except Exception as e:
-            print(f"Error parsing datetime '{text}': {e}")
+            logger.warning("Error parsing datetime '%s': %s", text, e)
             return None
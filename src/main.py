@@ -54,8 +54,8 @@ async def main(
             try:
                 # Scrape current program
                 print("📥 Fetching current program...")
-                with source_registry.get_scraper(source_info.source_id) as scraper:
-                    current_films = scraper.scrape()
+                async with source_registry.get_scraper(source_info.source_id) as scraper:
+                    current_films = await scraper.scrape()
 
                 print(f"✅ Found {len(current_films)} films")
 
@@ -120,7 +120,7 @@ async def main(
             mongodb_uri = os.getenv('MONGODB_URI')
             if mongodb_uri:
                 client = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000)
-                client['nuernberg_kino_bot']['subscribers'].find_one()
+                client['nuernberg_kino_bot']['users'].find_one()
                 print("📡 MongoDB keep-alive ping OK")
         except Exception as e:
             print(f"⚠️  MongoDB ping failed: {e}")
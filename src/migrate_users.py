@@ -0,0 +1,62 @@
+"""One-off migration: merge subscribers, languages and user_versions into users."""
+
+import os
+import sys
+from dotenv import load_dotenv
+from pymongo import MongoClient, UpdateOne
+
+# Load environment variables
+load_dotenv()
+
+# Old collection -> field it contributes to the users document
+LEGACY_FIELDS = {
+    'subscribers': 'sources',
+    'languages': 'language',
+    'user_versions': 'version',
+}
+
+
+def main() -> int:
+    """
+    Copy per-user data from the legacy collections into users (_id = chat_id).
+
+    Only fields missing from a users document are filled in, so a re-run never
+    overwrites values the webhook has written since. The legacy collections are
+    left untouched so they can be dropped by hand once the webhook runs on users.
+
+    Returns:
+        Exit code
+    """
+    mongodb_uri = os.getenv('MONGODB_URI')
+    if not mongodb_uri:
+        print("❌ MONGODB_URI environment variable not set", file=sys.stderr)
+        return 1
+
+    db = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000)['nuernberg_kino_bot']
+
+    for collection_name, field in LEGACY_FIELDS.items():
+        # Pipeline update: keep the current value, fall back to the legacy one
+        operations = [
+            UpdateOne(
+                {'_id': doc['chat_id']},
+                [{'$set': {field: {'$ifNull': [f'${field}', {'$literal': doc[field]}]}}}],
+                upsert=True
+            )
+            for doc in db[collection_name].find({field: {'$exists': True}})
+        ]
+        if not operations:
+            print(f"{collection_name}: nothing to migrate")
+            continue
+
+        result = db['users'].bulk_write(operations, ordered=False)
+        print(
+            f"{collection_name}: {len(operations)} documents "
+            f"({result.upserted_count} new users, {result.modified_count} filled in)"
+        )
+
+    print("✨ Migration complete!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
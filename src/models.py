@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Showtime:
     """Represents a single film showtime."""
 
@@ -14,13 +14,17 @@ class Showtime:
     room: str  # e.g., "Kino 2"
     language: Optional[str] = None  # e.g., "OV", "OmU"
 
+    def key(self) -> tuple:
+        """Tuple identifying this showtime, used for change detection."""
+        return (self.date, self.time, self.room, self.language)
+
     def __str__(self) -> str:
         """Human-readable representation."""
         lang_info = f" ({self.language})" if self.language else ""
         return f"{self.date} {self.time} - {self.room}{lang_info}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Film:
     """Represents a film with all its information."""
 
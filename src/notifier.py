@@ -33,15 +33,12 @@ class TelegramNotifier:
             raise ValueError("MONGODB_URI environment variable not set")
         client = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000)
         self._db = client['nuernberg_kino_bot']
-        self._subscribers_collection = self._db['subscribers']
+        # One document per user: {_id: chat_id, sources: [...], ...}
+        self._users_collection = self._db['users']
 
     def get_subscribers_for_source(self, source_id: str) -> Set[int]:
         """Get all subscriber chat IDs for a specific source from MongoDB."""
-        docs = self._subscribers_collection.find(
-            {'sources': source_id},
-            {'chat_id': 1}
-        )
-        return {doc['chat_id'] for doc in docs}
+        return set(self._users_collection.distinct('_id', {'sources': source_id}))
 
     async def send_update_notification(
         self,
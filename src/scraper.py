@@ -1,13 +1,35 @@
 """Web scraper for Meisengeige cinema program."""
 
+import asyncio
+import logging
 import re
-from typing import List, Optional
+import sys
+from typing import List, Optional, Union
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .models import Film, Showtime
 from .base_scraper import BaseCinemaScraper
 
+logger = logging.getLogger(__name__)
+
+_DURATION_RE = re.compile(r'(\d+)\s*min')
+# Substring match on the class attribute, avoids running a regex per <span>
+_AGE_RATING_SELECTOR = 'span[class*="age-rating--"]'
+# Only the film list items are parsed into a tree; head, scripts and navigation are skipped
+_FILM_STRAINER = SoupStrainer('li', class_='filmapi-container__list--li')
+
+
+def _looks_like_time(text: str) -> bool:
+    """Check that text starts with an H:MM or HH:MM time (no regex in the cell loop)."""
+    colon = text.find(':', 1, 3)
+    return (
+        colon > 0
+        and len(text) >= colon + 3
+        and text[:colon].isdigit()
+        and text[colon + 1:colon + 3].isdigit()
+    )
+
 
 class MeisengeigeScraper(BaseCinemaScraper):
     """Scraper for Meisengeige cinema program page."""
@@ -26,31 +48,32 @@ class MeisengeigeScraper(BaseCinemaScraper):
         """Return program page URL."""
         return self.BASE_URL
 
-    def fetch_page(self) -> str:
+    async def fetch_page(self) -> bytes:
         """
         Fetch the Meisengeige program page.
 
         Returns:
-            HTML content as string
+            Raw HTML bytes (decoded by lxml while parsing, so no extra
+            decoded copy of the page is kept in memory)
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        response = self.client.get(self.BASE_URL)
+        response = await self.client.get(self.BASE_URL)
         response.raise_for_status()
-        return response.text
+        return response.content
 
-    def parse_films(self, html: str) -> List[Film]:
+    def parse_films(self, html: Union[str, bytes]) -> List[Film]:
         """
         Parse films from HTML content.
 
         Args:
-            html: HTML content as string
+            html: HTML content as string or raw bytes
 
         Returns:
             List of Film objects
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml', parse_only=_FILM_STRAINER)
 
         # Find all film containers
         film_containers = soup.find_all('li', class_='filmapi-container__list--li')
@@ -89,7 +112,7 @@ class MeisengeigeScraper(BaseCinemaScraper):
             genres = [genre.text.strip() for genre in genre_elems]
 
             # Extract FSK rating
-            fsk_elem = container.find('span', class_=re.compile('age-rating--'))
+            fsk_elem = container.select_one(_AGE_RATING_SELECTOR)
             fsk_rating = fsk_elem.text.strip() if fsk_elem else None
 
             # Extract duration
@@ -97,7 +120,7 @@ class MeisengeigeScraper(BaseCinemaScraper):
             duration_elem = container.find('i', class_='icon-clock')
             if duration_elem and duration_elem.parent:
                 duration_text = duration_elem.parent.text.strip()
-                duration_match = re.search(r'(\d+)\s*min', duration_text)
+                duration_match = _DURATION_RE.search(duration_text)
                 if duration_match:
                     duration = int(duration_match.group(1))
 
@@ -128,7 +151,7 @@ class MeisengeigeScraper(BaseCinemaScraper):
             )
 
         except Exception as e:
-            print(f"Error parsing film: {e}")
+            logger.warning("Error parsing film: %s", e)
             return None
 
     def _parse_showtimes(self, container) -> List[Showtime]:
@@ -162,7 +185,7 @@ class MeisengeigeScraper(BaseCinemaScraper):
             for cell in header_cells[1:]:
                 date_text = cell.get_text(strip=True)
                 if date_text:
-                    dates.append(date_text)
+                    dates.append(sys.intern(date_text))
 
         if not dates:
             return showtimes
@@ -172,16 +195,18 @@ class MeisengeigeScraper(BaseCinemaScraper):
         if not tbody:
             return showtimes
 
-        rows = tbody.find_all('tr')
+        # Rows and cells are direct children, so don't search the cell subtrees for them
+        rows = tbody.find_all('tr', recursive=False)
         for row in rows:
             # First element is <th> containing room and language info
-            room_header = row.find('th')
+            room_header = row.find('th', recursive=False)
             if not room_header:
                 continue
 
             # Extract room name
             room_div = room_header.find('div', class_='font-semibold')
-            room = room_div.get_text(strip=True) if room_div else "Unknown"
+            # Interned: the same few rooms, dates and languages repeat across all films
+            room = sys.intern(room_div.get_text(strip=True)) if room_div else "Unknown"
 
             # Extract language (OV, OmU, etc.)
             language = None
@@ -191,10 +216,10 @@ class MeisengeigeScraper(BaseCinemaScraper):
                 if lang_span:
                     lang_text = lang_span.get_text(strip=True)
                     if lang_text:
-                        language = lang_text
+                        language = sys.intern(lang_text)
 
             # Get time cells (all <td> elements)
-            time_cells = row.find_all('td')
+            time_cells = row.find_all('td', recursive=False)
 
             # Match each time cell with corresponding date
             for idx, cell in enumerate(time_cells):
@@ -207,7 +232,7 @@ class MeisengeigeScraper(BaseCinemaScraper):
                     time_span = time_link.find('span', class_='link-text')
                     if time_span:
                         time_text = time_span.get_text(strip=True)
-                        if time_text and re.match(r'\d{1,2}:\d{2}', time_text):
+                        if _looks_like_time(time_text):
                             showtimes.append(
                                 Showtime(
                                     date=dates[idx],
@@ -219,15 +244,18 @@ class MeisengeigeScraper(BaseCinemaScraper):
 
         return showtimes
 
-    def scrape(self) -> List[Film]:
+    async def scrape(self) -> List[Film]:
         """
         Scrape the Meisengeige program page and return list of films.
 
+        Parsing is CPU-bound, so it runs in a worker thread to keep the
+        event loop free for other requests.
+
         Returns:
             List of Film objects
 
         Raises:
             httpx.HTTPError: If request fails
         """
-        html = self.fetch_page()
-        return self.parse_films(html)
+        html = await self.fetch_page()
+        return await asyncio.to_thread(self.parse_films, html)
@@ -39,7 +39,6 @@ class SourceRegistry:
             scraper_class=scraper_class
         )
         self._sources[info.source_id] = info
-        instance.client.close()
 
     def get_source(self, source_id: str) -> SourceInfo:
         """
@@ -42,8 +42,10 @@ class Storage:
             source_id=self.source_id,  # Add source ID
         )
 
+        # Serialize in one go and write once instead of streaming many small chunks
+        payload = json.dumps(snapshot.to_dict(), ensure_ascii=False, indent=2)
         with open(self.snapshot_file, 'w', encoding='utf-8') as f:
-            json.dump(snapshot.to_dict(), f, ensure_ascii=False, indent=2)
+            f.write(payload)
 
     def load_snapshot(self) -> Optional[ProgramSnapshot]:
         """
@@ -118,11 +120,7 @@ class Storage:
             return True
 
         # Compare showtimes
-        old_showtimes = set(
-            (st.date, st.time, st.room, st.language) for st in old_film.showtimes
-        )
-        new_showtimes = set(
-            (st.date, st.time, st.room, st.language) for st in new_film.showtimes
-        )
+        old_showtimes = {st.key() for st in old_film.showtimes}
+        new_showtimes = {st.key() for st in new_film.showtimes}
 
         return old_showtimes != new_showtimes